@@ -0,0 +1,129 @@
+"""Fixtures for the Scene Router selection benchmarks.
+
+Run with ``pytest benchmarks``. Results are saved as JSON under ``.benchmarks``
+and can be compared between releases with ``--benchmark-compare``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from datetime import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from astral import LocationInfo
+import pytest
+
+from custom_components.scene_router.const import (
+    CONF_CONDITION,
+    CONF_LIGHT_ENTITIES,
+    CONF_NAME,
+    CONF_REQUIRED_CUSTOM_CONDITIONS,
+    CONF_SCENE,
+    CONF_SCENE_CONFIGS,
+    DATA_SUN_ELEVATION_CACHE,
+    DOMAIN,
+    ConditionType,
+)
+from custom_components.scene_router.scene_router import SceneRouter
+from custom_components.scene_router.sun import SunElevationCache
+
+LOCATION = LocationInfo("Home", "Home", "UTC", 52.52, 13.40)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Always save benchmark results as JSON."""
+    config.option.benchmark_autosave = True
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Return a dedicated event loop for driving the router coroutines."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def hass() -> Iterator[MagicMock]:
+    """Return a stubbed HomeAssistant instance."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {DATA_SUN_ELEVATION_CACHE: SunElevationCache()}}
+    hass.states.get.return_value = None
+
+    with (
+        patch("custom_components.scene_router.scene_router.dr.async_get"),
+        patch(
+            "custom_components.scene_router.scene_router.get_astral_location",
+            return_value=(LOCATION, 0.0),
+        ),
+        patch(
+            "custom_components.scene_router.scene_router.condition_helper.async_validate_condition_config",
+            AsyncMock(side_effect=lambda _hass, config: config),
+        ),
+        patch(
+            "custom_components.scene_router.scene_router.condition_helper.async_from_config",
+            AsyncMock(return_value=lambda _hass, _variables: True),
+        ),
+    ):
+        yield hass
+
+
+def _condition_state(condition: ConditionType, index: int, scene_count: int) -> str:
+    """Return a condition value spreading the scenes over the day."""
+    if condition == ConditionType.SUN_BELOW:
+        return str(round(10.0 - 16.0 * index / scene_count, 1))
+    minutes = index * 1440 // scene_count
+    return time(minutes // 60, minutes % 60).isoformat()
+
+
+@pytest.fixture
+def make_router(
+    hass: MagicMock, loop: asyncio.AbstractEventLoop
+) -> Callable[..., SceneRouter]:
+    """Return a factory for compiled routers with stubbed condition entities."""
+
+    def _make_router(
+        scene_count: int,
+        condition_count: int = 0,
+        condition: ConditionType = ConditionType.TIME_AFTER,
+        name: str = "Benchmark",
+    ) -> SceneRouter:
+        options: dict[str, Any] = {
+            CONF_NAME: name,
+            CONF_LIGHT_ENTITIES: ["light.benchmark"],
+            CONF_SCENE_CONFIGS: [
+                {
+                    CONF_SCENE: f"scene.benchmark_{index}",
+                    CONF_CONDITION: condition,
+                    CONF_REQUIRED_CUSTOM_CONDITIONS: [
+                        {
+                            "condition": "state",
+                            "entity_id": f"input_boolean.benchmark_{index}_{number}",
+                            "state": "on",
+                        }
+                        for number in range(condition_count)
+                    ],
+                }
+                for index in range(scene_count)
+            ],
+        }
+        config_entry = MagicMock(entry_id=name, options=options)
+        scene_router = SceneRouter(hass, config_entry)
+
+        for index, scene_config in enumerate(
+            scene_router.scene_router_config.scene_configs
+        ):
+            scene_router.condition_entities[scene_config.scene] = {
+                condition: SimpleNamespace(
+                    entity_id=f"{condition}.benchmark_{index}",
+                    state=_condition_state(condition, index, scene_count),
+                )
+            }
+
+        loop.run_until_complete(scene_router.async_compile_conditions())
+        return scene_router
+
+    return _make_router
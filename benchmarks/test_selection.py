@@ -0,0 +1,172 @@
+"""Benchmarks for the scene selection hot path."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import tracemalloc
+
+import pytest
+
+from custom_components.scene_router.const import ConditionType
+from custom_components.scene_router.scene_router import SceneRouter
+
+CONDITION_TYPES = [ConditionType.TIME_AFTER, ConditionType.SUN_BELOW]
+
+
+def _record_allocations(
+    benchmark, loop: asyncio.AbstractEventLoop, *scene_routers: SceneRouter
+) -> None:
+    """Record the peak memory allocated by one selection of all routers."""
+
+    async def _select_all() -> list[tuple[str, str] | None]:
+        return await asyncio.gather(
+            *(scene_router.selected_scene for scene_router in scene_routers)
+        )
+
+    tracemalloc.start()
+    try:
+        loop.run_until_complete(_select_all())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_allocated_bytes"] = peak
+
+
+@pytest.mark.parametrize("condition", CONDITION_TYPES)
+@pytest.mark.parametrize("scene_count", [1, 10, 50, 100, 500])
+def test_selected_scene_by_scene_count(
+    benchmark,
+    loop: asyncio.AbstractEventLoop,
+    make_router: Callable[..., SceneRouter],
+    condition: ConditionType,
+    scene_count: int,
+) -> None:
+    """Benchmark selection latency as the number of scenes grows."""
+    scene_router = make_router(scene_count, condition=condition)
+
+    _record_allocations(benchmark, loop, scene_router)
+    result = benchmark(lambda: loop.run_until_complete(scene_router.selected_scene))
+
+    assert result is not None
+
+
+@pytest.mark.parametrize("condition", CONDITION_TYPES)
+@pytest.mark.parametrize("condition_count", [0, 1, 5, 20])
+def test_selected_scene_by_condition_count(
+    benchmark,
+    loop: asyncio.AbstractEventLoop,
+    make_router: Callable[..., SceneRouter],
+    condition: ConditionType,
+    condition_count: int,
+) -> None:
+    """Benchmark selection latency as the number of custom conditions grows."""
+    scene_router = make_router(20, condition_count, condition)
+
+    _record_allocations(benchmark, loop, scene_router)
+    result = benchmark(lambda: loop.run_until_complete(scene_router.selected_scene))
+
+    assert result is not None
+
+
+@pytest.mark.parametrize("cache", ["cold", "warm"])
+@pytest.mark.parametrize("condition_count", [1, 5, 20])
+def test_selected_scene_by_condition_cache(
+    benchmark,
+    loop: asyncio.AbstractEventLoop,
+    make_router: Callable[..., SceneRouter],
+    cache: str,
+    condition_count: int,
+) -> None:
+    """Benchmark selection with and without cached custom condition results.
+
+    The cold cache discards all results before each selection, as a state
+    change of every referenced entity would.
+    """
+    scene_router = make_router(20, condition_count)
+    entity_ids = scene_router.referenced_entity_ids
+
+    def _clear_cache() -> None:
+        for entity_id in entity_ids:
+            scene_router.invalidate_condition_results(entity_id)
+
+    def _select() -> tuple[str, str] | None:
+        return loop.run_until_complete(scene_router.selected_scene)
+
+    if cache == "cold":
+        result = benchmark.pedantic(_select, setup=_clear_cache, rounds=100)
+    else:
+        _select()
+        result = benchmark(_select)
+
+    assert result is not None
+    assert (scene_router.stats.custom_condition_cache_hits > 0) == (cache == "warm")
+
+
+@pytest.mark.parametrize("condition", CONDITION_TYPES)
+@pytest.mark.parametrize("router_count", [1, 10, 50])
+def test_selected_scene_by_router_count(
+    benchmark,
+    loop: asyncio.AbstractEventLoop,
+    make_router: Callable[..., SceneRouter],
+    condition: ConditionType,
+    router_count: int,
+) -> None:
+    """Benchmark one coordinator tick of many routers."""
+    scene_routers = [
+        make_router(10, 2, condition, f"Benchmark {index}")
+        for index in range(router_count)
+    ]
+
+    async def _select_all() -> list[tuple[str, str] | None]:
+        return await asyncio.gather(
+            *(scene_router.selected_scene for scene_router in scene_routers)
+        )
+
+    _record_allocations(benchmark, loop, *scene_routers)
+    results = benchmark(lambda: loop.run_until_complete(_select_all()))
+
+    assert all(results)
+
+
+@pytest.mark.parametrize("condition", CONDITION_TYPES)
+def test_timeline_rebuild(
+    benchmark,
+    loop: asyncio.AbstractEventLoop,
+    make_router: Callable[..., SceneRouter],
+    condition: ConditionType,
+) -> None:
+    """Benchmark selection when the timeline has to be rebuilt every time."""
+    scene_router = make_router(50, condition=condition)
+
+    def _select_cold() -> tuple[str, str] | None:
+        scene_router.invalidate_timeline()
+        return loop.run_until_complete(scene_router.selected_scene)
+
+    result = benchmark(_select_cold)
+
+    assert result is not None
+
+
+@pytest.mark.parametrize("condition", CONDITION_TYPES)
+@pytest.mark.parametrize("day_count", [1, 7])
+def test_preview(
+    benchmark,
+    loop: asyncio.AbstractEventLoop,
+    make_router: Callable[..., SceneRouter],
+    condition: ConditionType,
+    day_count: int,
+) -> None:
+    """Benchmark previewing one sample per minute over whole days."""
+    scene_router = make_router(50, condition=condition)
+    start = datetime(2025, 6, 21)
+    datetimes = [
+        start + timedelta(minutes=minute) for minute in range(1440 * day_count)
+    ]
+
+    result = benchmark(
+        lambda: loop.run_until_complete(scene_router.async_preview(datetimes))
+    )
+
+    assert len(result) == len(datetimes)
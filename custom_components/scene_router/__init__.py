@@ -8,9 +8,11 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 
 from .const import (
     CONF_CONDITION,
@@ -18,16 +20,27 @@ from .const import (
     CONF_REQUIRED_CUSTOM_CONDITIONS,
     CONF_SCENE_CONFIGS,
     DATA_COORDINATORS,
+    DATA_DEPENDENCY_INDEX,
     DATA_SCENE_ROUTERS,
+    DATA_SCHEDULER,
     DATA_STORE,
+    DATA_SUN_ELEVATION_CACHE,
     DOMAIN,
     SIGNAL_ENTRY_UPDATED,
 )
+from . import validation
 from .coordinator import SceneRouterCoordinator
+from .dependency_index import SceneRouterDependencyIndex
 from .entity import _on_entry_updated
+from .models import SceneRouterConfig
 from .scene_router import SceneRouter
+from .scheduler import SceneRouterScheduler
+from .services import async_setup_services
+from .store import SceneRouterStore
+from .sun import SunElevationCache
+from .yaml_import import async_import_routers
 
-CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+CONFIG_SCHEMA = validation.CONFIG_SCHEMA
 PLATFORMS = [
     Platform.NUMBER,
     Platform.SCENE,
@@ -35,7 +48,28 @@ PLATFORMS = [
     Platform.TIME,
 ]
 _LOGGER = logging.getLogger(__name__)
-STORAGE_VERSION = 1
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Scene Router services and import YAML configured routers."""
+    async_setup_services(hass)
+
+    # Also without YAML routers, so routers imported before are removed.
+    await async_import_routers(
+        hass, await _async_get_store(hass), config.get(DOMAIN, [])
+    )
+
+    return True
+
+
+async def _async_get_store(hass: HomeAssistant) -> SceneRouterStore:
+    """Return the shared store, loading it on first use."""
+    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if DATA_STORE not in data:
+        store = SceneRouterStore(hass)
+        await store.async_load()
+        data[DATA_STORE] = store
+    return data[DATA_STORE]
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -47,22 +81,30 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     _LOGGER.debug("Config entry data: %s", config_entry.data)
     _LOGGER.debug("Config entry options: %s", config_entry.options)
 
-    hass.data.setdefault(DOMAIN, {})
-    store = Store(hass, key=DOMAIN, version=STORAGE_VERSION)
-    data: dict[str, Any] = await store.async_load()
-    if data is None:
-        _LOGGER.debug("No stored data found, initializing empty data")
-        data = {}
-        await store.async_save(data)
-    hass.data[DOMAIN][DATA_STORE] = store
-
-    data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    await _async_get_store(hass)
+    data: dict[str, Any] = hass.data[DOMAIN]
     scene_routers: dict[str, SceneRouter] = data.setdefault(DATA_SCENE_ROUTERS, {})
     coordinators: dict[str, SceneRouterCoordinator] = data.setdefault(
         DATA_COORDINATORS, {}
     )
 
+    if DATA_SUN_ELEVATION_CACHE not in data:
+        sun_elevation_cache = SunElevationCache()
+        sun_elevation_cache.async_setup(hass)
+        data[DATA_SUN_ELEVATION_CACHE] = sun_elevation_cache
+
+    if DATA_SCHEDULER not in data:
+        scheduler = SceneRouterScheduler(hass)
+        scheduler.async_setup()
+        data[DATA_SCHEDULER] = scheduler
+
+    if DATA_DEPENDENCY_INDEX not in data:
+        dependency_index = SceneRouterDependencyIndex(hass)
+        dependency_index.async_setup()
+        data[DATA_DEPENDENCY_INDEX] = dependency_index
+
     scene_router = SceneRouter(hass, config_entry)
+    await scene_router.async_compile_conditions()
     scene_routers[config_entry.entry_id] = scene_router
 
     coordinator = SceneRouterCoordinator(
@@ -72,15 +114,18 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
     coordinators[config_entry.entry_id] = coordinator
 
-    async_dispatcher_connect(
-        hass,
-        f"{DOMAIN}_{config_entry.entry_id}_{SIGNAL_ENTRY_UPDATED}",
-        partial(
-            _on_entry_updated,
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
             hass,
-            config_entry,
-            scene_router,
-        ),
+            f"{DOMAIN}_{config_entry.entry_id}_{SIGNAL_ENTRY_UPDATED}",
+            partial(
+                _on_entry_updated,
+                hass,
+                config_entry,
+                scene_router,
+                coordinator,
+            ),
+        )
     )
 
     await hass.config_entries.async_forward_entry_setups(
@@ -111,7 +156,26 @@ async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> Non
     """Handle options update."""
     _LOGGER.debug("Updating Scene Router config entry %s", config_entry.entry_id)
 
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    scene_routers: dict[str, SceneRouter] = hass.data.get(DOMAIN, {}).get(
+        DATA_SCENE_ROUTERS, {}
+    )
+    new_scene_router_config = SceneRouterConfig.from_dict(config_entry.options)
+    if (
+        not (scene_router := scene_routers.get(config_entry.entry_id))
+        or scene_router.scene_router_config.name != new_scene_router_config.name
+    ):
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+
+    if scene_router.scene_router_config == new_scene_router_config:
+        return
+
+    async_dispatcher_send(
+        hass,
+        f"{DOMAIN}_{config_entry.entry_id}_{SIGNAL_ENTRY_UPDATED}",
+        scene_router.scene_router_config,
+        new_scene_router_config,
+    )
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -129,10 +193,15 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         )
         return False
 
+    await data[DATA_STORE].async_flush()
+
     scene_routers.pop(config_entry.entry_id)
     coordinators.pop(config_entry.entry_id)
     if not scene_routers:
         _LOGGER.debug("No more SceneRouter instances, clearing hass.data[%s]", DOMAIN)
+        data[DATA_SUN_ELEVATION_CACHE].async_shutdown()
+        data[DATA_SCHEDULER].async_shutdown()
+        data[DATA_DEPENDENCY_INDEX].async_shutdown()
         hass.data.pop(DOMAIN, None)
 
     await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
@@ -9,6 +9,10 @@ import voluptuous as vol
 
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN
+from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
+    SensorDeviceClass,
+)
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -17,27 +21,46 @@ from homeassistant.config_entries import (
 )
 from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import (
     CONF_CONDITION,
+    CONF_CONDITION_CACHE_TTL,
     CONF_ENABLE_AUTO_CHANGE,
+    CONF_ENABLE_EVALUATION_TRACE,
+    CONF_ENABLE_EVENT_DRIVEN_UPDATES,
+    CONF_ENABLE_LIGHT_DIFFING,
+    CONF_ENABLE_SUN_TABLE,
     CONF_ERROR_CONDITION_REQUIRED,
     CONF_ERROR_NO_LIGHT_ENTITIES,
     CONF_ERROR_NO_SCENE_CONFIGS,
     CONF_ERROR_SCENE_REQUIRED,
     CONF_FORCING_CUSTOM_CONDITIONS,
     CONF_LIGHT_ENTITIES,
+    CONF_LUX_HYSTERESIS,
+    CONF_LUX_SENSORS,
+    CONF_MAX_CONCURRENT_CONDITIONS,
+    CONF_MAX_RESULT_AGE,
     CONF_NAME,
+    CONF_PAUSE_WHILE_LIGHTS_OFF,
     CONF_REQUIRED_CUSTOM_CONDITIONS,
     CONF_SCENE,
     CONF_SCENE_CONFIGS,
+    CONF_TRANSITION,
+    DATA_CONDITION_VALUES,
+    DEFAULT_CONDITION_CACHE_TTL_SECONDS,
     DEFAULT_ENABLE_AUTO_CHANGE,
+    DEFAULT_ENABLE_EVALUATION_TRACE,
+    DEFAULT_ENABLE_EVENT_DRIVEN_UPDATES,
+    DEFAULT_ENABLE_LIGHT_DIFFING,
+    DEFAULT_ENABLE_SUN_TABLE,
+    DEFAULT_LUX_HYSTERESIS,
+    DEFAULT_MAX_CONCURRENT_CONDITIONS,
+    DEFAULT_MAX_RESULT_AGE_SECONDS,
+    DEFAULT_PAUSE_WHILE_LIGHTS_OFF,
+    DEFAULT_TRANSITION_SECONDS,
     DOMAIN,
-    SIGNAL_ENTRY_UPDATED,
     ConditionType,
 )
-from .models import SceneRouterConfig
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,6 +87,111 @@ def _get_schema(
                     ),
                 },
             ): bool,
+            vol.Required(
+                CONF_ENABLE_EVENT_DRIVEN_UPDATES,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_ENABLE_EVENT_DRIVEN_UPDATES,
+                        DEFAULT_ENABLE_EVENT_DRIVEN_UPDATES,
+                    ),
+                },
+            ): bool,
+            vol.Required(
+                CONF_PAUSE_WHILE_LIGHTS_OFF,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_PAUSE_WHILE_LIGHTS_OFF, DEFAULT_PAUSE_WHILE_LIGHTS_OFF
+                    ),
+                },
+            ): bool,
+            vol.Required(
+                CONF_ENABLE_EVALUATION_TRACE,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_ENABLE_EVALUATION_TRACE, DEFAULT_ENABLE_EVALUATION_TRACE
+                    ),
+                },
+            ): bool,
+            vol.Required(
+                CONF_ENABLE_LIGHT_DIFFING,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_ENABLE_LIGHT_DIFFING, DEFAULT_ENABLE_LIGHT_DIFFING
+                    ),
+                },
+            ): bool,
+            vol.Required(
+                CONF_TRANSITION,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_TRANSITION, DEFAULT_TRANSITION_SECONDS
+                    ),
+                },
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=300,
+                    step=0.1,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_ENABLE_SUN_TABLE,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_ENABLE_SUN_TABLE, DEFAULT_ENABLE_SUN_TABLE
+                    ),
+                },
+            ): bool,
+            vol.Required(
+                CONF_MAX_RESULT_AGE,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_MAX_RESULT_AGE, DEFAULT_MAX_RESULT_AGE_SECONDS
+                    ),
+                },
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=3600,
+                    step=1,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_MAX_CONCURRENT_CONDITIONS,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_MAX_CONCURRENT_CONDITIONS,
+                        DEFAULT_MAX_CONCURRENT_CONDITIONS,
+                    ),
+                },
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=1,
+                    max=64,
+                    step=1,
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_CONDITION_CACHE_TTL,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_CONDITION_CACHE_TTL, DEFAULT_CONDITION_CACHE_TTL_SECONDS
+                    ),
+                },
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=86400,
+                    step=1,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
             vol.Required(
                 CONF_LIGHT_ENTITIES,
                 description={
@@ -75,6 +203,34 @@ def _get_schema(
                     multiple=True,
                 )
             ),
+            vol.Optional(
+                CONF_LUX_SENSORS,
+                description={
+                    "suggested_value": user_input.get(CONF_LUX_SENSORS, []),
+                },
+            ): selector.EntitySelector(
+                selector.EntitySelectorConfig(
+                    domain=SENSOR_DOMAIN,
+                    device_class=SensorDeviceClass.ILLUMINANCE,
+                    multiple=True,
+                )
+            ),
+            vol.Required(
+                CONF_LUX_HYSTERESIS,
+                description={
+                    "suggested_value": user_input.get(
+                        CONF_LUX_HYSTERESIS, DEFAULT_LUX_HYSTERESIS
+                    ),
+                },
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=10000,
+                    step=1,
+                    unit_of_measurement="lx",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
             vol.Optional(
                 CONF_SCENE_CONFIGS,
                 description={
@@ -189,6 +345,19 @@ class SceneRouterConfigFlow(ConfigFlow, domain=DOMAIN):
             title=user_input[CONF_NAME], data={}, options=user_input
         )
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Handle a router imported from the YAML configuration."""
+        await self.async_set_unique_id(import_data[CONF_NAME])
+        self._abort_if_unique_id_configured()
+
+        options = dict(import_data)
+        condition_values = options.pop(DATA_CONDITION_VALUES, {})
+        return self.async_create_entry(
+            title=options[CONF_NAME],
+            data={DATA_CONDITION_VALUES: condition_values},
+            options=options,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -227,14 +396,4 @@ class OptionsFlowHandler(OptionsFlow):
                 errors=errors,
             )
 
-        previous_options = SceneRouterConfig.from_dict(self.options)
-        new_options = SceneRouterConfig.from_dict(user_input)
-
-        async_dispatcher_send(
-            self.hass,
-            f"{DOMAIN}_{self.config_entry.entry_id}_{SIGNAL_ENTRY_UPDATED}",
-            previous_options,
-            new_options,
-        )
-
         return self.async_create_entry(title=user_input[CONF_NAME], data=user_input)
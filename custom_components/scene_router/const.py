@@ -8,11 +8,28 @@ DATA_SCENE_ROUTERS = "scene_routers"
 DATA_CONDITION_VALUES = "condition_values"
 DATA_COORDINATORS = "coordinators"
 DATA_STORE = "store"
+DATA_SUN_ELEVATION_CACHE = "sun_elevation_cache"
+DATA_SCHEDULER = "scheduler"
+DATA_DEPENDENCY_INDEX = "dependency_index"
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY_SECONDS = 10
 
 CONF_ENTRY_DEFAULT_NAME = "Scene Router"
 CONF_NAME = "name"
 CONF_LIGHT_ENTITIES = "light_entities"
+CONF_LUX_SENSORS = "lux_sensors"
+CONF_LUX_HYSTERESIS = "lux_hysteresis"
 CONF_ENABLE_AUTO_CHANGE = "enable_auto_change"
+CONF_ENABLE_EVENT_DRIVEN_UPDATES = "enable_event_driven_updates"
+CONF_MAX_RESULT_AGE = "max_result_age"
+CONF_MAX_CONCURRENT_CONDITIONS = "max_concurrent_conditions"
+CONF_CONDITION_CACHE_TTL = "condition_cache_ttl"
+CONF_ENABLE_EVALUATION_TRACE = "enable_evaluation_trace"
+CONF_PAUSE_WHILE_LIGHTS_OFF = "pause_while_lights_off"
+CONF_ENABLE_SUN_TABLE = "enable_sun_table"
+CONF_ENABLE_LIGHT_DIFFING = "enable_light_diffing"
+CONF_TRANSITION = "transition"
 CONF_SCENE_CONFIGS = "scene_configs"
 CONF_SCENE = "scene"
 CONF_CONDITION = "condition"
@@ -30,12 +47,42 @@ DEFAULT_ENABLE_PREVIEW_SENSOR = True
 DEFAULT_ENABLE_DEVICE = True
 DEFAULT_ENABLE_AUTO_CHANGE = True
 DEFAULT_UPDATE_INTERVAL_SECONDS = 10
+DEFAULT_ENABLE_EVENT_DRIVEN_UPDATES = True
+DEFAULT_FALLBACK_UPDATE_INTERVAL_SECONDS = 300
+DEFAULT_SUN_ELEVATION_CACHE_SIZE = 256
+DEFAULT_MAX_RESULT_AGE_SECONDS = 10
+DEFAULT_MAX_CONCURRENT_CONDITIONS = 8
+DEFAULT_CONDITION_CACHE_TTL_SECONDS = 300
+DEFAULT_STATS_WINDOW_SIZE = 100
+DEFAULT_SCHEDULER_JITTER_SECONDS = 2.0
+DEFAULT_ENABLE_EVALUATION_TRACE = False
+DEFAULT_TRACE_SIZE = 20
+DEFAULT_PAUSE_WHILE_LIGHTS_OFF = False
+DEFAULT_ENABLE_SUN_TABLE = False
+DEFAULT_ENABLE_LIGHT_DIFFING = False
+DEFAULT_TRANSITION_SECONDS = 0.0
+DEFAULT_LUX_HYSTERESIS = 10.0
+DEFAULT_LUX_WINDOW_SIZE = 5
+DEFAULT_LUX_EMA_ALPHA = 0.5
+DEFAULT_LUX_REFRESH_COOLDOWN_SECONDS = 30
+DEFAULT_MAX_CONCURRENT_ACTIVATIONS = 8
+DEFAULT_PREVIEW_INTERVAL_SECONDS = 60
+DEFAULT_MAX_PREVIEW_SAMPLES = 10080
 
 SIGNAL_ENTRY_UPDATED = "entry_updated"
+SIGNAL_LOCATION_UPDATED = "location_updated"
+SIGNAL_CONDITIONS_ADDED = "conditions_added"
+SIGNAL_SCENE_APPLIED = "scene_applied"
+
+SERVICE_ACTIVATE = "activate"
+SERVICE_PREVIEW = "preview"
 
 
 class ConditionType(StrEnum):
     """Enumeration for condition types."""
 
     SUN_BELOW = "sun_below"
+    SUN_ABOVE = "sun_above"
     TIME_AFTER = "time_after"
+    TIME_BEFORE = "time_before"
+    LUX_BELOW = "lux_below"
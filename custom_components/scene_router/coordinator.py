@@ -1,14 +1,44 @@
 """Coordinator for Scene Router integration."""
 
-from datetime import timedelta
+from datetime import datetime
 import logging
+from time import monotonic
+
+from astral.location import Location
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_ON
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_UPDATE_INTERVAL_SECONDS
+from .const import (
+    DATA_DEPENDENCY_INDEX,
+    DATA_SCHEDULER,
+    DEFAULT_FALLBACK_UPDATE_INTERVAL_SECONDS,
+    DEFAULT_LUX_REFRESH_COOLDOWN_SECONDS,
+    DEFAULT_SCHEDULER_JITTER_SECONDS,
+    DEFAULT_UPDATE_INTERVAL_SECONDS,
+    DOMAIN,
+    SIGNAL_LOCATION_UPDATED,
+    ConditionType,
+)
+from .dependency_index import SceneRouterDependencyIndex
 from .scene_router import SceneRouter
+from .scheduler import SceneRouterScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,10 +59,36 @@ class SceneRouterCoordinator(DataUpdateCoordinator[tuple[str, str] | None]):
             _LOGGER,
             config_entry=config_entry,
             name=scene_router.scene_router_config.name,
-            update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL_SECONDS),
         )
 
         self.scene_router = scene_router
+        self.evaluation_interval = self._get_evaluation_interval()
+        self.paused = False
+        self.activating = False
+        self._unsub_timeline_wakeup: CALLBACK_TYPE | None = None
+        self._unsub_lux_changes: CALLBACK_TYPE | None = None
+        self._lux_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DEFAULT_LUX_REFRESH_COOLDOWN_SECONDS,
+            immediate=True,
+            function=self.async_refresh,
+        )
+        self._last_evaluated_at: float | None = None
+        self._dirty = True
+
+    def _get_evaluation_interval(self) -> int:
+        """Return the polling interval of the scene router.
+
+        Event driven routers only fall back to slow polling if none of their
+        custom conditions depend on the time, as those trigger no state change.
+        """
+        if (
+            self.scene_router.scene_router_config.enable_event_driven_updates
+            and not self.scene_router.has_time_dependent_conditions
+        ):
+            return DEFAULT_FALLBACK_UPDATE_INTERVAL_SECONDS
+        return DEFAULT_UPDATE_INTERVAL_SECONDS
 
     async def _async_setup(self) -> None:
         """Set up the coordinator."""
@@ -40,18 +96,323 @@ class SceneRouterCoordinator(DataUpdateCoordinator[tuple[str, str] | None]):
             "Setting up SceneRouterCoordinator for router '%s'",
             self.scene_router.scene_router_config.name,
         )
+        self.paused = (
+            self.scene_router.scene_router_config.pause_while_lights_off
+            and not self.any_light_on
+        )
+        self._async_subscribe_lux_changes()
+        scheduler: SceneRouterScheduler = self.hass.data[DOMAIN][DATA_SCHEDULER]
+        self.config_entry.async_on_unload(
+            scheduler.async_register(self.config_entry.entry_id, self)
+        )
+        dependency_index: SceneRouterDependencyIndex = self.hass.data[DOMAIN][
+            DATA_DEPENDENCY_INDEX
+        ]
+        self.config_entry.async_on_unload(
+            dependency_index.async_register(self.config_entry.entry_id, self)
+        )
+        self.config_entry.async_on_unload(
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_{SIGNAL_LOCATION_UPDATED}",
+                self._handle_location_updated,
+            )
+        )
         await self._async_update_data()
 
+    @property
+    def any_light_on(self) -> bool:
+        """Return whether any light of the scene router is on."""
+        return any(
+            (state := self.hass.states.get(light_entity_id)) and state.state == STATE_ON
+            for light_entity_id in self.scene_router.scene_router_config.light_entities
+        )
+
+    @callback
+    def async_handle_dependency_change(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle a state change of an entity the scene router references."""
+        self._dirty = True
+        self.scene_router.invalidate_condition_results(event.data["entity_id"])
+        scene_router_config = self.scene_router.scene_router_config
+        if (
+            scene_router_config.pause_while_lights_off
+            and event.data["entity_id"] in scene_router_config.light_entities
+        ):
+            self._handle_light_change(event)
+        elif scene_router_config.enable_event_driven_updates:
+            self._handle_state_change(event)
+
+    @callback
+    def _async_subscribe_lux_changes(self) -> None:
+        """Feed the lux sensor readings of LUX_BELOW routers into the lux filter."""
+        self._async_unsubscribe_lux_changes()
+
+        scene_router_config = self.scene_router.scene_router_config
+        if not scene_router_config.lux_sensors or not any(
+            scene_config.condition == ConditionType.LUX_BELOW
+            for scene_config in scene_router_config.scene_configs
+        ):
+            return
+
+        self.scene_router.lux_filter.clear()
+        for lux_sensor in scene_router_config.lux_sensors:
+            if (
+                reading := self._get_lux_reading(self.hass.states.get(lux_sensor))
+            ) is not None:
+                self.scene_router.lux_filter.add(reading)
+        self.scene_router.update_lux_states()
+
+        self._unsub_lux_changes = async_track_state_change_event(
+            self.hass, scene_router_config.lux_sensors, self._handle_lux_change
+        )
+
+    @callback
+    def _async_unsubscribe_lux_changes(self) -> None:
+        """Unsubscribe from lux sensor state changes."""
+        if self._unsub_lux_changes:
+            self._unsub_lux_changes()
+            self._unsub_lux_changes = None
+
+    @staticmethod
+    def _get_lux_reading(state: State | None) -> float | None:
+        """Return the illuminance of a lux sensor state, if it is valid."""
+        if state is None:
+            return None
+        try:
+            return float(state.state)
+        except ValueError:
+            return None
+
+    @callback
+    def async_config_updated(self) -> None:
+        """Re-index the entities of the updated scene router config."""
+        self._dirty = True
+        scene_router_config = self.scene_router.scene_router_config
+        self.evaluation_interval = self._get_evaluation_interval()
+
+        self.paused = (
+            scene_router_config.pause_while_lights_off and not self.any_light_on
+        )
+        dependency_index: SceneRouterDependencyIndex = self.hass.data[DOMAIN][
+            DATA_DEPENDENCY_INDEX
+        ]
+        dependency_index.async_update(self.config_entry.entry_id)
+
+        self._async_subscribe_lux_changes()
+
+    @callback
+    def _handle_light_change(self, _event: Event[EventStateChangedData]) -> None:
+        """Pause when all lights turn off and resume when any light turns on."""
+        lights_on = self.any_light_on
+        if lights_on and self.paused:
+            _LOGGER.debug(
+                "SceneRouterCoordinator '%s' resuming evaluation",
+                self.scene_router.scene_router_config.name,
+            )
+            self.paused = False
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_refresh(),
+                f"{self.name} resume refresh",
+            )
+        elif not lights_on and not self.paused:
+            _LOGGER.debug(
+                "SceneRouterCoordinator '%s' pausing evaluation while lights are off",
+                self.scene_router.scene_router_config.name,
+            )
+            self.paused = True
+            self._dirty = True
+            self._async_cancel_timeline_wakeup()
+            self.async_update_listeners()
+
+    @callback
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a refresh when a referenced entity changes."""
+        if self.paused:
+            return
+        _LOGGER.debug(
+            "SceneRouterCoordinator '%s' refreshing due to state change of '%s'",
+            self.scene_router.scene_router_config.name,
+            event.data["entity_id"],
+        )
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_request_refresh(),
+            f"{self.name} state change refresh",
+        )
+
+    @callback
+    def _handle_lux_change(self, event: Event[EventStateChangedData]) -> None:
+        """Refresh, rate limited, when the illuminance crosses a threshold."""
+        if (reading := self._get_lux_reading(event.data["new_state"])) is None:
+            return
+        self.scene_router.lux_filter.add(reading)
+        if not self.scene_router.update_lux_states():
+            return
+        self._dirty = True
+        if self.paused:
+            return
+        _LOGGER.debug(
+            "SceneRouterCoordinator '%s' refreshing due to illuminance of %s lx",
+            self.scene_router.scene_router_config.name,
+            self.scene_router.lux_filter.value,
+        )
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._lux_refresh_debouncer.async_call(),
+            f"{self.name} lux refresh",
+        )
+
+    @callback
+    def async_invalidate_timeline(self) -> None:
+        """Rebuild the timeline and discard the result on the next selection."""
+        self._dirty = True
+        self.scene_router.invalidate_timeline()
+
+    @callback
+    def _handle_location_updated(self) -> None:
+        """Rebuild the timeline when the home location changes."""
+        self.async_invalidate_timeline()
+        if self.paused:
+            return
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_request_refresh(),
+            f"{self.name} location refresh",
+        )
+
+    @callback
+    def _async_schedule_timeline_wakeup(self, now_dt: datetime | None = None) -> None:
+        """Schedule a refresh at the next boundary after the evaluated time.
+
+        A boundary between the evaluated time and now is already due, so the
+        wakeup fires right away.
+        """
+        self._async_cancel_timeline_wakeup()
+
+        wakeup_at = self.scene_router.next_timeline_change_at(now_dt or dt_util.now())
+        _LOGGER.debug(
+            "SceneRouterCoordinator '%s' scheduling timeline wakeup at %s",
+            self.scene_router.scene_router_config.name,
+            wakeup_at,
+        )
+        self._unsub_timeline_wakeup = async_track_point_in_time(
+            self.hass, self._handle_timeline_wakeup, wakeup_at
+        )
+
+    @callback
+    def _async_cancel_timeline_wakeup(self) -> None:
+        """Cancel the scheduled timeline wakeup."""
+        if self._unsub_timeline_wakeup:
+            self._unsub_timeline_wakeup()
+            self._unsub_timeline_wakeup = None
+
+    @callback
+    def _handle_timeline_wakeup(self, _now: datetime) -> None:
+        """Refresh when the scene timeline reaches its next boundary."""
+        self._unsub_timeline_wakeup = None
+        self._dirty = True
+        if self.paused:
+            return
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_refresh(),
+            f"{self.name} timeline refresh",
+        )
+
+    def is_due(self, now: float) -> bool:
+        """Return whether the scheduler should evaluate this router.
+
+        The scheduler's jitter delays the start of an evaluation after its tick,
+        so that much is tolerated to not skip every other tick.
+        """
+        if self.paused:
+            return False
+        return (
+            self._last_evaluated_at is None
+            or now - self._last_evaluated_at
+            >= self.evaluation_interval - DEFAULT_SCHEDULER_JITTER_SECONDS
+        )
+
+    async def _async_evaluate(
+        self, now_dt: datetime | None = None, location: Location | None = None
+    ) -> tuple[str, str] | None:
+        """Evaluate the scene router and record the evaluation duration.
+
+        Changes made while the evaluation runs mark the result dirty again.
+        """
+        self._dirty = False
+        started_at = monotonic()
+        selected_scene = await self.scene_router.async_select_scene(now_dt, location)
+        self._last_evaluated_at = started_at
+        self.scene_router.stats.record_evaluation(monotonic() - started_at)
+        return selected_scene
+
+    @property
+    def result_is_current(self) -> bool:
+        """Return whether the last result still holds.
+
+        The result is dirty once a referenced entity, a condition entity, the
+        illuminance, the timeline or the config changed since it was evaluated.
+        Results of routers with time dependent custom conditions additionally
+        expire after the maximum result age.
+        """
+        if (
+            self._dirty
+            or not self.last_update_success
+            or self._last_evaluated_at is None
+        ):
+            return False
+        return (
+            not self.scene_router.has_time_dependent_conditions
+            or monotonic() - self._last_evaluated_at
+            <= self.scene_router.scene_router_config.max_result_age
+        )
+
+    async def async_get_selected_scene(self) -> tuple[str, str] | None:
+        """Return the selected scene, re-evaluating only if the last result is stale."""
+        if self.result_is_current:
+            return self.data
+
+        _LOGGER.debug(
+            "SceneRouterCoordinator '%s' result is stale, re-evaluating",
+            self.scene_router.scene_router_config.name,
+        )
+        selected_scene = await self._async_evaluate()
+        self.async_set_updated_data(selected_scene)
+        return selected_scene
+
+    async def async_scheduled_refresh(
+        self, now_dt: datetime, location: Location
+    ) -> None:
+        """Refresh as part of a scheduler tick sharing its time and location.
+
+        The time and location are passed down rather than stored, so refreshes
+        running concurrently keep evaluating at their own time.
+        """
+        try:
+            selected_scene = await self._async_evaluate(now_dt, location)
+        except Exception:
+            self.logger.exception("Unexpected error fetching %s data", self.name)
+            self.last_update_success = False
+            self.async_update_listeners()
+            return
+
+        self.async_set_updated_data(selected_scene)
+        self._async_schedule_timeline_wakeup(now_dt)
+
     async def async_shutdown(self):
         """Shutdown the coordinator."""
+        self._async_unsubscribe_lux_changes()
+        self._lux_refresh_debouncer.async_shutdown()
+        self._async_cancel_timeline_wakeup()
         return await super().async_shutdown()
 
     async def _async_update_data(self) -> tuple[str, str] | None:
         """Fetch data from the SceneRouter."""
-        _LOGGER.debug(
-            "Updating data for SceneRouterCoordinator '%s'",
-            self.scene_router.scene_router_config.name,
-        )
-        selected_scene = await self.scene_router.selected_scene
+        selected_scene = await self._async_evaluate()
         self.data = selected_scene
+        self._async_schedule_timeline_wakeup()
         return selected_scene
@@ -0,0 +1,109 @@
+"""Shared entity dependency index for the Scene Router integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import SceneRouterCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SceneRouterDependencyIndex:
+    """Index of the scene routers depending on each entity.
+
+    A single state change listener serves all scene routers and fans out each
+    change only to the routers referencing the changed entity.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the SceneRouterDependencyIndex."""
+        self.hass = hass
+        self.entry_ids_by_entity_id: dict[str, set[str]] = {}
+        self._entity_ids_by_entry_id: dict[str, set[str]] = {}
+        self._coordinators: dict[str, SceneRouterCoordinator] = {}
+        self._unsub_state_changes: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Start the shared state change listener."""
+        self._unsub_state_changes = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._handle_state_change,
+            event_filter=self._filter_state_change,
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the shared state change listener."""
+        if self._unsub_state_changes:
+            self._unsub_state_changes()
+            self._unsub_state_changes = None
+
+    @callback
+    def async_register(
+        self, entry_id: str, coordinator: SceneRouterCoordinator
+    ) -> CALLBACK_TYPE:
+        """Index the entities of a scene router and forward their changes to it."""
+        self._coordinators[entry_id] = coordinator
+        self.async_update(entry_id)
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.pop(entry_id, None)
+            self._async_set_entity_ids(entry_id, set())
+
+        return _unregister
+
+    @callback
+    def async_update(self, entry_id: str) -> None:
+        """Re-index the entities of a scene router after its config changed."""
+        if coordinator := self._coordinators.get(entry_id):
+            self._async_set_entity_ids(
+                entry_id, coordinator.scene_router.referenced_entity_ids
+            )
+
+    @callback
+    def _async_set_entity_ids(self, entry_id: str, entity_ids: set[str]) -> None:
+        """Update the index with the entity IDs of a scene router."""
+        previous_entity_ids = self._entity_ids_by_entry_id.pop(entry_id, set())
+        for entity_id in previous_entity_ids - entity_ids:
+            entry_ids = self.entry_ids_by_entity_id[entity_id]
+            entry_ids.discard(entry_id)
+            if not entry_ids:
+                del self.entry_ids_by_entity_id[entity_id]
+        for entity_id in entity_ids - previous_entity_ids:
+            self.entry_ids_by_entity_id.setdefault(entity_id, set()).add(entry_id)
+        if entity_ids:
+            self._entity_ids_by_entry_id[entry_id] = entity_ids
+
+        _LOGGER.debug(
+            "Scene Router dependency index holds %d entities for entry %s",
+            len(entity_ids),
+            entry_id,
+        )
+
+    @callback
+    def _filter_state_change(self, event_data: EventStateChangedData) -> bool:
+        """Return whether any scene router references the changed entity."""
+        return event_data["entity_id"] in self.entry_ids_by_entity_id
+
+    @callback
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the scene routers referencing the entity."""
+        for entry_id in tuple(
+            self.entry_ids_by_entity_id.get(event.data["entity_id"], ())
+        ):
+            if coordinator := self._coordinators.get(entry_id):
+                coordinator.async_handle_dependency_change(event)
@@ -0,0 +1,63 @@
+"""Diagnostics support for Scene Router integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_COORDINATORS,
+    DATA_SCENE_ROUTERS,
+    DATA_SUN_ELEVATION_CACHE,
+    DOMAIN,
+)
+from .coordinator import SceneRouterCoordinator
+from .scene_router import SceneRouter
+from .sun import SunElevationCache
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: dict[str, Any] = hass.data[DOMAIN]
+    scene_router: SceneRouter = data[DATA_SCENE_ROUTERS][config_entry.entry_id]
+    coordinator: SceneRouterCoordinator = data[DATA_COORDINATORS][config_entry.entry_id]
+    sun_elevation_cache: SunElevationCache = data[DATA_SUN_ELEVATION_CACHE]
+    timeline = scene_router.get_timeline(dt_util.now())
+
+    return {
+        "selected_scene": coordinator.data,
+        "compiled_conditions": len(scene_router.compiled_conditions),
+        "referenced_entity_ids": sorted(scene_router.referenced_entity_ids),
+        "timeline": {
+            "date": timeline.date.isoformat(),
+            "points": [
+                {
+                    "scene": point.scene_config.scene,
+                    "condition": point.scene_config.condition,
+                    "from_time": point.from_time.isoformat(),
+                    "to_time": point.to_time.isoformat() if point.to_time else None,
+                }
+                for point in timeline.points
+            ],
+        },
+        "stats": {
+            "evaluations": scene_router.stats.evaluations,
+            "custom_conditions_evaluated": (
+                scene_router.stats.custom_conditions_evaluated
+            ),
+            "custom_condition_cache_hits": (
+                scene_router.stats.custom_condition_cache_hits
+            ),
+            "last_evaluation_duration": scene_router.stats.last_evaluation_duration,
+            "evaluation_latency_p50": scene_router.stats.percentile(50),
+            "evaluation_latency_p95": scene_router.stats.percentile(95),
+        },
+        "sun_elevation_cache": sun_elevation_cache.cache_info()._asdict(),
+        "traces": list(scene_router.traces),
+        "options": dict(config_entry.options),
+    }
@@ -8,20 +8,24 @@ from homeassistant.components.time import DOMAIN as TIME_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import EntityDescription
-from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ConditionType
+from .const import DOMAIN, SIGNAL_CONDITIONS_ADDED, ConditionType
 from .coordinator import SceneRouterCoordinator
-from .models import SceneRouterConfig
+from .models import SceneConfig, SceneRouterConfig
 from .scene_router import SceneRouter
+from .store import SceneRouterStore
 
 _LOGGER = logging.getLogger(__name__)
 
 CONDITION_TO_DOMAIN = {
     ConditionType.SUN_BELOW: NUMBER_DOMAIN,
+    ConditionType.SUN_ABOVE: NUMBER_DOMAIN,
     ConditionType.TIME_AFTER: TIME_DOMAIN,
+    ConditionType.TIME_BEFORE: TIME_DOMAIN,
+    ConditionType.LUX_BELOW: NUMBER_DOMAIN,
 }
 
 
@@ -48,8 +52,14 @@ def _get_entity_key(
     match condition:
         case ConditionType.SUN_BELOW:
             return f"{scene_router_name}_{scene_entity_id.split('.')[1]}_sun_below"
+        case ConditionType.SUN_ABOVE:
+            return f"{scene_router_name}_{scene_entity_id.split('.')[1]}_sun_above"
         case ConditionType.TIME_AFTER:
             return f"{scene_router_name}_{scene_entity_id.split('.')[1]}_time_after"
+        case ConditionType.TIME_BEFORE:
+            return f"{scene_router_name}_{scene_entity_id.split('.')[1]}_time_before"
+        case ConditionType.LUX_BELOW:
+            return f"{scene_router_name}_{scene_entity_id.split('.')[1]}_lux_below"
         case _:
             raise ValueError(f"Unsupported condition type: {condition}")
 
@@ -59,8 +69,14 @@ def _get_translation_key(condition: ConditionType) -> str:
     match condition:
         case ConditionType.SUN_BELOW:
             return "sun_below"
+        case ConditionType.SUN_ABOVE:
+            return "sun_above"
         case ConditionType.TIME_AFTER:
             return "time_after"
+        case ConditionType.TIME_BEFORE:
+            return "time_before"
+        case ConditionType.LUX_BELOW:
+            return "lux_below"
         case _:
             raise ValueError(f"Unsupported condition type: {condition}")
 
@@ -104,17 +120,19 @@ async def _on_entry_updated(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     scene_router: SceneRouter,
+    coordinator: SceneRouterCoordinator,
     previous_scene_router_config: SceneRouterConfig,
     new_scene_router_config: SceneRouterConfig,
 ) -> None:
-    """Handle updates to the scene router configuration."""
+    """Apply an updated scene router configuration without reloading the entry."""
     for previous_scene_config in previous_scene_router_config.scene_configs:
-        new_scene_config = next(
-            scene_config
-            for scene_config in new_scene_router_config.scene_configs
-            if scene_config.scene == previous_scene_config.scene
+        new_scene_config = new_scene_router_config.scene_configs_by_scene.get(
+            previous_scene_config.scene
         )
-        if previous_scene_config.condition != new_scene_config.condition:
+        if previous_scene_config.condition is not None and (
+            new_scene_config is None
+            or previous_scene_config.condition != new_scene_config.condition
+        ):
             entity_id = _get_entity_id(
                 hass,
                 config_entry,
@@ -138,6 +156,27 @@ async def _on_entry_updated(
             if condition_entities:
                 condition_entities.pop(previous_scene_config.condition, None)
 
+    added_scene_configs: list[SceneConfig] = []
+    for new_scene_config in new_scene_router_config.scene_configs:
+        previous_scene_config = previous_scene_router_config.scene_configs_by_scene.get(
+            new_scene_config.scene
+        )
+        if new_scene_config.condition is not None and (
+            previous_scene_config is None
+            or previous_scene_config.condition != new_scene_config.condition
+        ):
+            added_scene_configs.append(new_scene_config)
+
+    await scene_router.async_apply_config(new_scene_router_config)
+    if added_scene_configs:
+        async_dispatcher_send(
+            hass,
+            f"{DOMAIN}_{config_entry.entry_id}_{SIGNAL_CONDITIONS_ADDED}",
+            added_scene_configs,
+        )
+    coordinator.async_config_updated()
+    await coordinator.async_request_refresh()
+
 
 class SceneRouterEntity(CoordinatorEntity[SceneRouterCoordinator]):
     """Base entity for Scene Router integration."""
@@ -168,7 +207,7 @@ class SceneRouterConditionEntity(SceneRouterEntity):
 
     def __init__(
         self,
-        store: Store,
+        store: SceneRouterStore,
         config_entry: ConfigEntry,
         scene_router: SceneRouter,
         coordinator: SceneRouterCoordinator,
@@ -0,0 +1,54 @@
+"""Illuminance smoothing for the Scene Router integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from statistics import median
+
+from .const import DEFAULT_LUX_EMA_ALPHA, DEFAULT_LUX_WINDOW_SIZE
+
+
+class LuxFilter:
+    """Smoothed illuminance of the lux sensors of a scene router.
+
+    Readings are kept in a fixed-size ring buffer whose median rejects single
+    outliers, and the median is exponentially smoothed to damp slow noise.
+    """
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_LUX_WINDOW_SIZE,
+        alpha: float = DEFAULT_LUX_EMA_ALPHA,
+    ) -> None:
+        """Initialize the LuxFilter."""
+        self.alpha = alpha
+        self.value: float | None = None
+        self._readings: deque[float] = deque(maxlen=window_size)
+
+    def add(self, reading: float) -> float:
+        """Add a reading and return the updated smoothed illuminance."""
+        self._readings.append(reading)
+        window_median = median(self._readings)
+        if self.value is None:
+            self.value = window_median
+        else:
+            self.value += self.alpha * (window_median - self.value)
+        return self.value
+
+    def clear(self) -> None:
+        """Discard all readings."""
+        self._readings.clear()
+        self.value = None
+
+
+def is_below(
+    value: float, threshold: float, hysteresis: float, was_below: bool
+) -> bool:
+    """Return whether the value is below the threshold with a hysteresis band.
+
+    Once below, the value has to rise above threshold + hysteresis to count as
+    above again, so readings around the threshold do not flap.
+    """
+    if was_below:
+        return value < threshold + hysteresis
+    return value < threshold
@@ -2,51 +2,145 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+import json
+import sys
 from typing import Any
 
 from .const import (
     CONF_CONDITION,
+    CONF_CONDITION_CACHE_TTL,
     CONF_ENABLE_AUTO_CHANGE,
+    CONF_ENABLE_EVALUATION_TRACE,
+    CONF_ENABLE_EVENT_DRIVEN_UPDATES,
+    CONF_ENABLE_LIGHT_DIFFING,
+    CONF_ENABLE_SUN_TABLE,
     CONF_FORCING_CUSTOM_CONDITIONS,
     CONF_LIGHT_ENTITIES,
+    CONF_LUX_HYSTERESIS,
+    CONF_LUX_SENSORS,
+    CONF_MAX_CONCURRENT_CONDITIONS,
+    CONF_MAX_RESULT_AGE,
     CONF_NAME,
+    CONF_PAUSE_WHILE_LIGHTS_OFF,
     CONF_REQUIRED_CUSTOM_CONDITIONS,
     CONF_SCENE,
     CONF_SCENE_CONFIGS,
+    CONF_TRANSITION,
+    DEFAULT_CONDITION_CACHE_TTL_SECONDS,
     DEFAULT_ENABLE_AUTO_CHANGE,
+    DEFAULT_ENABLE_EVALUATION_TRACE,
+    DEFAULT_ENABLE_EVENT_DRIVEN_UPDATES,
+    DEFAULT_ENABLE_LIGHT_DIFFING,
+    DEFAULT_ENABLE_SUN_TABLE,
+    DEFAULT_LUX_HYSTERESIS,
+    DEFAULT_MAX_CONCURRENT_CONDITIONS,
+    DEFAULT_MAX_RESULT_AGE_SECONDS,
+    DEFAULT_PAUSE_WHILE_LIGHTS_OFF,
+    DEFAULT_TRANSITION_SECONDS,
     ConditionType,
 )
 
 
-@dataclass
+def _intern_entity_ids(entity_ids: Iterable[str]) -> tuple[str, ...]:
+    """Return the entity IDs as a tuple of interned strings."""
+    return tuple(sys.intern(entity_id) for entity_id in entity_ids)
+
+
+def _get_condition_key(cfg: dict[str, Any]) -> str:
+    """Return a stable cache key for a custom condition dict."""
+    return json.dumps(cfg, sort_keys=True, default=str)
+
+
+def _key_conditions(
+    cfgs: Iterable[dict[str, Any]],
+) -> tuple[tuple[str, dict[str, Any]], ...]:
+    """Return the custom condition dicts paired with their cache keys."""
+    return tuple((_get_condition_key(cfg), cfg) for cfg in cfgs)
+
+
+@dataclass(frozen=True, slots=True)
 class SceneConfig:
     """Configuration for a scene in the Scene Router."""
 
     scene: str
-    condition: ConditionType
-    forcing_custom_conditions: list[dict[str, Any]] | None = None
-    required_custom_conditions: list[dict[str, Any]] | None = None
+    condition: ConditionType | None
+    forcing_custom_conditions: tuple[dict[str, Any], ...] = field(
+        default=(), hash=False
+    )
+    required_custom_conditions: tuple[dict[str, Any], ...] = field(
+        default=(), hash=False
+    )
+    keyed_forcing_custom_conditions: tuple[tuple[str, dict[str, Any]], ...] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+    keyed_required_custom_conditions: tuple[tuple[str, dict[str, Any]], ...] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        """Pair the custom conditions with their cache keys."""
+        object.__setattr__(
+            self,
+            "keyed_forcing_custom_conditions",
+            _key_conditions(self.forcing_custom_conditions),
+        )
+        object.__setattr__(
+            self,
+            "keyed_required_custom_conditions",
+            _key_conditions(self.required_custom_conditions),
+        )
 
     @classmethod
     def from_dict(cls, value: dict[str, Any]) -> SceneConfig:
         """Create a SceneConfig from a dictionary."""
         return cls(
-            scene=value[CONF_SCENE],
-            condition=value[CONF_CONDITION],
-            forcing_custom_conditions=value.get(CONF_FORCING_CUSTOM_CONDITIONS),
-            required_custom_conditions=value.get(CONF_REQUIRED_CUSTOM_CONDITIONS),
+            scene=sys.intern(value[CONF_SCENE]),
+            condition=(
+                ConditionType(condition)
+                if (condition := value.get(CONF_CONDITION))
+                else None
+            ),
+            forcing_custom_conditions=tuple(
+                value.get(CONF_FORCING_CUSTOM_CONDITIONS) or ()
+            ),
+            required_custom_conditions=tuple(
+                value.get(CONF_REQUIRED_CUSTOM_CONDITIONS) or ()
+            ),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SceneRouterConfig:
     """Configuration for the Scene Router integration."""
 
     name: str
-    light_entities: list[str]
-    scene_configs: list[SceneConfig]
+    light_entities: tuple[str, ...]
+    scene_configs: tuple[SceneConfig, ...]
+    lux_sensors: tuple[str, ...] = ()
     enable_auto_change: bool = DEFAULT_ENABLE_AUTO_CHANGE
+    enable_event_driven_updates: bool = DEFAULT_ENABLE_EVENT_DRIVEN_UPDATES
+    max_result_age: float = DEFAULT_MAX_RESULT_AGE_SECONDS
+    max_concurrent_conditions: int = DEFAULT_MAX_CONCURRENT_CONDITIONS
+    condition_cache_ttl: float = DEFAULT_CONDITION_CACHE_TTL_SECONDS
+    enable_evaluation_trace: bool = DEFAULT_ENABLE_EVALUATION_TRACE
+    pause_while_lights_off: bool = DEFAULT_PAUSE_WHILE_LIGHTS_OFF
+    enable_sun_table: bool = DEFAULT_ENABLE_SUN_TABLE
+    lux_hysteresis: float = DEFAULT_LUX_HYSTERESIS
+    enable_light_diffing: bool = DEFAULT_ENABLE_LIGHT_DIFFING
+    transition: float = DEFAULT_TRANSITION_SECONDS
+    scene_configs_by_scene: dict[str, SceneConfig] = field(
+        init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index the scene configs by their scene entity ID."""
+        object.__setattr__(
+            self,
+            "scene_configs_by_scene",
+            {scene_config.scene: scene_config for scene_config in self.scene_configs},
+        )
 
     @classmethod
     def from_dict(cls, value: dict[str, Any]) -> SceneRouterConfig:
@@ -54,12 +148,41 @@ class SceneRouterConfig:
 
         return cls(
             name=value[CONF_NAME],
-            light_entities=value[CONF_LIGHT_ENTITIES],
-            scene_configs=[
+            light_entities=_intern_entity_ids(value[CONF_LIGHT_ENTITIES]),
+            scene_configs=tuple(
                 SceneConfig.from_dict(scene_config)
                 for scene_config in value[CONF_SCENE_CONFIGS]
-            ],
+            ),
+            lux_sensors=_intern_entity_ids(value.get(CONF_LUX_SENSORS) or ()),
             enable_auto_change=value.get(
                 CONF_ENABLE_AUTO_CHANGE, DEFAULT_ENABLE_AUTO_CHANGE
             ),
+            enable_event_driven_updates=value.get(
+                CONF_ENABLE_EVENT_DRIVEN_UPDATES, DEFAULT_ENABLE_EVENT_DRIVEN_UPDATES
+            ),
+            max_result_age=value.get(
+                CONF_MAX_RESULT_AGE, DEFAULT_MAX_RESULT_AGE_SECONDS
+            ),
+            max_concurrent_conditions=int(
+                value.get(
+                    CONF_MAX_CONCURRENT_CONDITIONS, DEFAULT_MAX_CONCURRENT_CONDITIONS
+                )
+            ),
+            condition_cache_ttl=float(
+                value.get(CONF_CONDITION_CACHE_TTL, DEFAULT_CONDITION_CACHE_TTL_SECONDS)
+            ),
+            enable_evaluation_trace=value.get(
+                CONF_ENABLE_EVALUATION_TRACE, DEFAULT_ENABLE_EVALUATION_TRACE
+            ),
+            pause_while_lights_off=value.get(
+                CONF_PAUSE_WHILE_LIGHTS_OFF, DEFAULT_PAUSE_WHILE_LIGHTS_OFF
+            ),
+            enable_sun_table=value.get(CONF_ENABLE_SUN_TABLE, DEFAULT_ENABLE_SUN_TABLE),
+            lux_hysteresis=float(
+                value.get(CONF_LUX_HYSTERESIS, DEFAULT_LUX_HYSTERESIS)
+            ),
+            enable_light_diffing=value.get(
+                CONF_ENABLE_LIGHT_DIFFING, DEFAULT_ENABLE_LIGHT_DIFFING
+            ),
+            transition=float(value.get(CONF_TRANSITION, DEFAULT_TRANSITION_SECONDS)),
         )
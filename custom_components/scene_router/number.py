@@ -1,5 +1,6 @@
 """Number platform for Scene Router integration."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 import logging
 from typing import Any
@@ -11,30 +12,41 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import DEGREE, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.const import DEGREE, LIGHT_LUX, EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.storage import Store
 
 from .const import (
     DATA_COORDINATORS,
     DATA_SCENE_ROUTERS,
     DATA_STORE,
     DOMAIN,
+    SIGNAL_CONDITIONS_ADDED,
     ConditionType,
 )
 from .coordinator import SceneRouterCoordinator
 from .entity import (
+    CONDITION_TO_DOMAIN,
     SceneRouterConditionEntity,
     SceneRouterConditionEntityDescription,
     _get_entity_key,
     _get_translation_key,
 )
+from .models import SceneConfig
 from .scene_router import SceneRouter
+from .store import SceneRouterStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum, maximum and unit of the threshold of each number condition.
+CONDITION_LIMITS: dict[ConditionType, tuple[float, float, str]] = {
+    ConditionType.SUN_BELOW: (-90.0, 90.0, DEGREE),
+    ConditionType.SUN_ABOVE: (-90.0, 90.0, DEGREE),
+    ConditionType.LUX_BELOW: (0.0, 100000.0, LIGHT_LUX),
+}
+
 
 @dataclass(frozen=True, kw_only=True)
 class SceneRouterNumberEntityDescription(
@@ -56,50 +68,66 @@ async def async_setup_entry(
     data: dict[str, Any] = hass.data[DOMAIN]
     scene_router: SceneRouter = data[DATA_SCENE_ROUTERS][config_entry.entry_id]
     coordinator: SceneRouterCoordinator = data[DATA_COORDINATORS][config_entry.entry_id]
-    store: Store = data[DATA_STORE]
-    entity_descriptions: list[NumberEntityDescription] = []
-
-    for scene_config in scene_router.scene_router_config.scene_configs:
-        if not (scene := er.async_get(hass).async_get(scene_config.scene)):
-            _LOGGER.warning(
-                "Scene '%s' not found in entity registry, skipping conditions",
-                scene_config.scene,
+    store: SceneRouterStore = data[DATA_STORE]
+
+    @callback
+    def _async_add_condition_entities(scene_configs: Iterable[SceneConfig]) -> None:
+        """Add entities for the scene configs with a matching condition."""
+        entity_descriptions: list[NumberEntityDescription] = []
+
+        for scene_config in scene_configs:
+            if not (scene := er.async_get(hass).async_get(scene_config.scene)):
+                _LOGGER.warning(
+                    "Scene '%s' not found in entity registry, skipping conditions",
+                    scene_config.scene,
+                )
+                continue
+
+            if CONDITION_TO_DOMAIN.get(scene_config.condition) != NUMBER_DOMAIN:
+                continue
+
+            native_min_value, native_max_value, native_unit_of_measurement = (
+                CONDITION_LIMITS[scene_config.condition]
+            )
+            entity_description = SceneRouterNumberEntityDescription(
+                key=_get_entity_key(
+                    scene_router.scene_router_config.name,
+                    scene_config.scene,
+                    scene_config.condition,
+                ),
+                translation_key=_get_translation_key(scene_config.condition),
+                translation_placeholders={
+                    "scene": scene.name or scene.original_name or scene_config.scene,
+                },
+                entity_category=EntityCategory.CONFIG,
+                native_min_value=native_min_value,
+                native_max_value=native_max_value,
+                native_step=1.0,
+                native_unit_of_measurement=native_unit_of_measurement,
+                mode=NumberMode.BOX,
+                condition_type=scene_config.condition,
+                scene_entity_id=scene_config.scene,
             )
-            continue
-
-        if scene_config.condition != ConditionType.SUN_BELOW:
-            continue
-
-        entity_description = SceneRouterNumberEntityDescription(
-            key=_get_entity_key(
-                scene_router.scene_router_config.name,
-                scene_config.scene,
-                scene_config.condition,
-            ),
-            translation_key=_get_translation_key(scene_config.condition),
-            translation_placeholders={
-                "scene": scene.name or scene.original_name or scene_config.scene,
-            },
-            entity_category=EntityCategory.CONFIG,
-            native_min_value=-90.0,
-            native_max_value=90.0,
-            native_step=1.0,
-            native_unit_of_measurement=DEGREE,
-            mode=NumberMode.BOX,
-            condition_type=scene_config.condition,
-            scene_entity_id=scene_config.scene,
+            entity_descriptions.append(entity_description)
+
+        async_add_entities(
+            SceneRouterNumberEntity(
+                store,
+                config_entry,
+                scene_router,
+                coordinator,
+                entity_description,
+            )
+            for entity_description in entity_descriptions
         )
-        entity_descriptions.append(entity_description)
-
-    async_add_entities(
-        SceneRouterNumberEntity(
-            store,
-            config_entry,
-            scene_router,
-            coordinator,
-            entity_description,
+
+    _async_add_condition_entities(scene_router.scene_router_config.scene_configs)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            f"{DOMAIN}_{config_entry.entry_id}_{SIGNAL_CONDITIONS_ADDED}",
+            _async_add_condition_entities,
         )
-        for entity_description in entity_descriptions
     )
 
 
@@ -110,8 +138,8 @@ class SceneRouterNumberEntity(SceneRouterConditionEntity, NumberEntity):
         """Handle entity which will be added to hass."""
         await super().async_added_to_hass()
 
-        data: dict[str, Any] = await self.store.async_load()
-        self._attr_native_value = data.get(self.entity_description.key, 0.0)
+        self._attr_native_value = self.store.get(self.entity_description.key, 0.0)
+        self.coordinator.async_invalidate_timeline()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
@@ -121,9 +149,8 @@ class SceneRouterNumberEntity(SceneRouterConditionEntity, NumberEntity):
             value,
         )
 
-        data: dict[str, Any] = await self.store.async_load()
-        data[self.entity_description.key] = value
-        await self.store.async_save(data)
+        self.store.async_set(self.entity_description.key, value)
         self._attr_native_value = value
+        self.coordinator.async_invalidate_timeline()
 
         await self.coordinator.async_request_refresh()
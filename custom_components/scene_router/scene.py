@@ -5,16 +5,24 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN, Scene as SceneEntity
+from homeassistant.components.scene import Scene as SceneEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_ENTITY_ID, SERVICE_TURN_ON, STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DATA_COORDINATORS, DATA_SCENE_ROUTERS, DOMAIN
+from .const import (
+    DATA_COORDINATORS,
+    DATA_SCENE_ROUTERS,
+    DATA_STORE,
+    DOMAIN,
+    SIGNAL_SCENE_APPLIED,
+)
 from .coordinator import SceneRouterCoordinator
 from .entity import SceneRouterEntity, SceneRouterEntityDescription
 from .scene_router import SceneRouter
+from .services import async_activate_coordinators
+from .store import SceneRouterStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,10 +36,12 @@ async def async_setup_entry(
     data: dict[str, Any] = hass.data[DOMAIN]
     scene_router: SceneRouter = data[DATA_SCENE_ROUTERS][config_entry.entry_id]
     coordinator: SceneRouterCoordinator = data[DATA_COORDINATORS][config_entry.entry_id]
+    store: SceneRouterStore = data[DATA_STORE]
 
     async_add_entities(
         [
             SceneRouterSceneEntity(
+                store,
                 config_entry,
                 scene_router,
                 coordinator,
@@ -49,30 +59,70 @@ class SceneRouterSceneEntity(SceneRouterEntity, SceneEntity):
 
     _attr_name = None
 
+    def __init__(
+        self,
+        store: SceneRouterStore,
+        config_entry: ConfigEntry,
+        scene_router: SceneRouter,
+        coordinator: SceneRouterCoordinator,
+        entity_description: SceneRouterEntityDescription,
+    ) -> None:
+        """Initialize the SceneRouterSceneEntity."""
+        super().__init__(config_entry, scene_router, coordinator, entity_description)
+        self.store = store
+        self._store_key = f"{config_entry.entry_id}_last_applied_scene"
+        self._last_applied_scene: str | None = None
+        self._lights_on = False
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added to hass."""
+        await super().async_added_to_hass()
+
+        self._last_applied_scene = self.store.get(self._store_key)
+        self._lights_on = self.coordinator.any_light_on
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_{self.config_entry.entry_id}_{SIGNAL_SCENE_APPLIED}",
+                self._handle_scene_applied,
+            )
+        )
+
+    @callback
+    def _async_set_last_applied_scene(self, scene_entity_id: str) -> None:
+        """Remember and persist the last scene applied by this router."""
+        self._last_applied_scene = scene_entity_id
+        self.store.async_set(self._store_key, scene_entity_id)
+
     async def async_activate(self) -> None:
         """Activate scene."""
-        if not (target := await self.scene_router.selected_scene_entity_id):
-            _LOGGER.warning("SceneRouter '%s' returned no scene", self.entity_id)
-            return
-
-        await self.hass.services.async_call(
-            SCENE_DOMAIN,
-            SERVICE_TURN_ON,
-            {CONF_ENTITY_ID: target},
-            blocking=True,
-        )
+        await async_activate_coordinators(self.hass, [self.coordinator])
+
+    @callback
+    def _handle_scene_applied(self, scene_entity_id: str) -> None:
+        """Handle the selected scene having been applied by this router."""
+        self._lights_on = self.coordinator.any_light_on
+        self._async_set_last_applied_scene(scene_entity_id)
 
     def _handle_coordinator_update(self) -> None:
-        if self.scene_router.scene_router_config.enable_auto_change:
-            if any(
-                (state := self.hass.states.get(light_entity_id))
-                and state.state == STATE_ON
-                for light_entity_id in self.scene_router.scene_router_config.light_entities
-            ):
-                _LOGGER.debug(
-                    "SceneRouter '%s' auto changing scene due to light state",
-                    self.entity_id,
-                )
-                self.hass.async_create_task(self.async_activate())
+        lights_on = self.coordinator.any_light_on
+        lights_turned_on = lights_on and not self._lights_on
+        self._lights_on = lights_on
+
+        if (
+            self.scene_router.scene_router_config.enable_auto_change
+            and not self.coordinator.activating
+            and lights_on
+            and self.coordinator.data
+            and (
+                lights_turned_on or self.coordinator.data[0] != self._last_applied_scene
+            )
+        ):
+            _LOGGER.debug(
+                "SceneRouter '%s' auto changing scene due to %s",
+                self.entity_id,
+                "lights turning on" if lights_turned_on else "scene change",
+            )
+            self.hass.async_create_task(self.async_activate())
 
         return super()._handle_coordinator_update()
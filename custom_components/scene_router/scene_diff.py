@@ -0,0 +1,276 @@
+"""Per-light scene diffing for the Scene Router integration."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Collection
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_BRIGHTNESS_PCT,
+    ATTR_COLOR_MODE,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_EFFECT,
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_RGBWW_COLOR,
+    ATTR_TRANSITION,
+    ATTR_WHITE,
+    ATTR_XY_COLOR,
+    DOMAIN as LIGHT_DOMAIN,
+    ColorMode,
+)
+from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN
+from homeassistant.const import (
+    CONF_ENTITIES,
+    CONF_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.util.color import color_temperature_mired_to_kelvin
+
+# Diffing reads the stored states of a scene through Home Assistant internals
+# that may change in any release: the private DATA_PLATFORM key of the
+# homeassistant scene platform and the scene_config.states attribute of its
+# HomeAssistantScene entities. Without them, scenes are applied as a whole.
+try:
+    from homeassistant.components.homeassistant.scene import (
+        DATA_PLATFORM,
+        HomeAssistantScene,
+    )
+except ImportError as err:
+    _SCENE_INTERNALS_ERROR: Exception | None = err
+else:
+    _SCENE_INTERNALS_ERROR = None
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_APPLY = "apply"
+
+# Legacy color temperature attributes of hand-written scenes.
+ATTR_COLOR_TEMP = "color_temp"
+ATTR_KELVIN = "kelvin"
+
+COLOR_MODE_TO_ATTRIBUTE = {
+    ColorMode.COLOR_TEMP: ATTR_COLOR_TEMP_KELVIN,
+    ColorMode.HS: ATTR_HS_COLOR,
+    ColorMode.RGB: ATTR_RGB_COLOR,
+    ColorMode.RGBW: ATTR_RGBW_COLOR,
+    ColorMode.RGBWW: ATTR_RGBWW_COLOR,
+    ColorMode.XY: ATTR_XY_COLOR,
+}
+
+COLOR_ATTRIBUTES = (
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_RGBWW_COLOR,
+    ATTR_XY_COLOR,
+    ATTR_WHITE,
+)
+
+# Attributes a light does not report in its state, so they are always applied.
+UNVERIFIABLE_ATTRIBUTES = frozenset({ATTR_WHITE})
+
+type LightCommand = tuple[str, tuple[tuple[str, Any], ...]]
+
+_scene_internals_unavailable_logged = False
+
+
+def _log_scene_internals_unavailable(error: Exception) -> None:
+    """Log once that scenes cannot be diffed with this Home Assistant version."""
+    global _scene_internals_unavailable_logged
+    if _scene_internals_unavailable_logged:
+        return
+    _scene_internals_unavailable_logged = True
+    _LOGGER.debug(
+        "Scene states are not available, applying scenes with %s.%s: %s",
+        SCENE_DOMAIN,
+        SERVICE_TURN_ON,
+        error,
+    )
+
+
+def get_scene_states(
+    hass: HomeAssistant, scene_entity_id: str
+) -> dict[str, State] | None:
+    """Return the stored entity states of a Home Assistant scene, if available."""
+    if _SCENE_INTERNALS_ERROR is not None:
+        _log_scene_internals_unavailable(_SCENE_INTERNALS_ERROR)
+        return None
+    try:
+        if (platform := hass.data.get(DATA_PLATFORM)) is None:
+            return None
+        if not isinstance(
+            scene := platform.entities.get(scene_entity_id), HomeAssistantScene
+        ):
+            return None
+        return scene.scene_config.states
+    except AttributeError as e:
+        _log_scene_internals_unavailable(e)
+        return None
+
+
+def _get_light_attributes(state: State) -> dict[str, Any] | None:
+    """Return the light.turn_on attributes needed to reproduce the state of a light.
+
+    Every supported attribute of the state is used, the color mode only picks
+    the color if the state has several. Returns None if the color cannot be
+    told apart, so the state has to be applied by the scene integration.
+    """
+    attributes: dict[str, Any] = {}
+    if (brightness := state.attributes.get(ATTR_BRIGHTNESS)) is not None:
+        attributes[ATTR_BRIGHTNESS] = brightness
+    elif (brightness_pct := state.attributes.get(ATTR_BRIGHTNESS_PCT)) is not None:
+        attributes[ATTR_BRIGHTNESS] = round(float(brightness_pct) * 255 / 100)
+
+    colors: dict[str, Any] = {}
+    for attribute in COLOR_ATTRIBUTES:
+        if (value := state.attributes.get(attribute)) is not None:
+            colors[attribute] = tuple(value) if isinstance(value, list) else value
+    if ATTR_COLOR_TEMP_KELVIN not in colors:
+        if (kelvin := state.attributes.get(ATTR_KELVIN)) is not None:
+            colors[ATTR_COLOR_TEMP_KELVIN] = int(kelvin)
+        elif (mireds := state.attributes.get(ATTR_COLOR_TEMP)) is not None:
+            colors[ATTR_COLOR_TEMP_KELVIN] = color_temperature_mired_to_kelvin(
+                float(mireds)
+            )
+    if len(colors) > 1:
+        attribute = COLOR_MODE_TO_ATTRIBUTE.get(state.attributes.get(ATTR_COLOR_MODE))
+        if attribute not in colors:
+            return None
+        colors = {attribute: colors[attribute]}
+    attributes.update(colors)
+
+    if (effect := state.attributes.get(ATTR_EFFECT)) is not None:
+        attributes[ATTR_EFFECT] = effect
+    return attributes
+
+
+def _is_light_in_state(current: State | None, attributes: dict[str, Any]) -> bool:
+    """Return whether a light is on with all the given attributes."""
+    if current is None or current.state != STATE_ON:
+        return False
+    if not UNVERIFIABLE_ATTRIBUTES.isdisjoint(attributes):
+        return False
+    for attribute, value in attributes.items():
+        current_value = current.attributes.get(attribute)
+        if isinstance(current_value, list):
+            current_value = tuple(current_value)
+        if current_value != value:
+            return False
+    return True
+
+
+@dataclass(slots=True)
+class SceneApplication:
+    """Service calls applying the selected scenes of one or more scene routers.
+
+    Scenes with stored states are diffed against the current states of the
+    router's lights, so only lights that differ are commanded. Lights needing
+    identical attributes share a single light service call.
+    """
+
+    scenes: defaultdict[float | None, list[str]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    light_commands: defaultdict[LightCommand, list[str]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    other_states: defaultdict[float | None, dict[str, dict[str, Any]]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+
+    def add_scene(
+        self,
+        hass: HomeAssistant,
+        scene_entity_id: str,
+        light_entity_ids: Collection[str],
+        enable_light_diffing: bool,
+        transition: float | None,
+    ) -> None:
+        """Add the scene applied by a scene router."""
+        if (
+            not enable_light_diffing
+            or (scene_states := get_scene_states(hass, scene_entity_id)) is None
+        ):
+            if scene_entity_id not in self.scenes[transition]:
+                self.scenes[transition].append(scene_entity_id)
+            return
+
+        transition_items = (
+            ((ATTR_TRANSITION, transition),) if transition is not None else ()
+        )
+        unchanged: list[str] = []
+        for entity_id, target in scene_states.items():
+            if (
+                entity_id not in light_entity_ids
+                or split_entity_id(entity_id)[0] != LIGHT_DOMAIN
+            ):
+                self.other_states[transition][entity_id] = {
+                    "state": target.state,
+                    **target.attributes,
+                }
+                continue
+
+            current = hass.states.get(entity_id)
+            if target.state == STATE_OFF:
+                if current is not None and current.state == STATE_OFF:
+                    unchanged.append(entity_id)
+                    continue
+                command: LightCommand = (SERVICE_TURN_OFF, transition_items)
+            elif (attributes := _get_light_attributes(target)) is None:
+                self.other_states[transition][entity_id] = {
+                    "state": target.state,
+                    **target.attributes,
+                }
+                continue
+            elif _is_light_in_state(current, attributes):
+                unchanged.append(entity_id)
+                continue
+            else:
+                command = (
+                    SERVICE_TURN_ON,
+                    tuple(sorted(attributes.items())) + transition_items,
+                )
+            self.light_commands[command].append(entity_id)
+
+        _LOGGER.debug(
+            "Applying scene '%s' skips unchanged lights %s", scene_entity_id, unchanged
+        )
+
+    def service_calls(self) -> list[tuple[str, str, dict[str, Any]]]:
+        """Return the domain, service and data of every call to make."""
+        calls: list[tuple[str, str, dict[str, Any]]] = [
+            (
+                SCENE_DOMAIN,
+                SERVICE_TURN_ON,
+                {CONF_ENTITY_ID: scene_entity_ids}
+                | ({ATTR_TRANSITION: transition} if transition is not None else {}),
+            )
+            for transition, scene_entity_ids in self.scenes.items()
+            if scene_entity_ids
+        ]
+        calls.extend(
+            (LIGHT_DOMAIN, service, {CONF_ENTITY_ID: entity_ids, **dict(items)})
+            for (service, items), entity_ids in self.light_commands.items()
+        )
+        calls.extend(
+            (
+                SCENE_DOMAIN,
+                SERVICE_APPLY,
+                {CONF_ENTITIES: entities}
+                | ({ATTR_TRANSITION: transition} if transition is not None else {}),
+            )
+            for transition, entities in self.other_states.items()
+            if entities
+        )
+        return calls
@@ -3,14 +3,29 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import time
+from collections import deque
+from collections.abc import Awaitable, Coroutine, Sequence
+from datetime import date, datetime, time, timedelta, tzinfo
 import logging
-from typing import Any, TypedDict
+from time import monotonic
+from typing import Any, Literal, TypedDict
 
-from astral.sun import SunDirection, time_at_elevation
+from astral import Observer
+from astral.location import Location
+from astral.sun import SunDirection
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_ABOVE,
+    CONF_BELOW,
+    CONF_CONDITION,
+    CONF_CONDITIONS,
+    CONF_FOR,
+    CONF_VALUE_TEMPLATE,
+)
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     condition as condition_helper,
     config_validation as cv,
@@ -18,13 +33,98 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.sun import get_astral_location
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, ConditionType
+from .const import (
+    DATA_STORE,
+    DATA_SUN_ELEVATION_CACHE,
+    DEFAULT_TRACE_SIZE,
+    DOMAIN,
+    ConditionType,
+)
+from .lux import LuxFilter, is_below
 from .models import SceneConfig, SceneRouterConfig
+from .stats import SceneRouterStats
+from .sun import SunElevationCache
+from .sun_table import SunTable
+from .timeline import (
+    SceneTimeline,
+    SceneTimelineChange,
+    SceneTimelinePoint,
+    preview_timeline,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+SUN_DIRECTIONS = {
+    ConditionType.SUN_BELOW: SunDirection.SETTING,
+    ConditionType.SUN_ABOVE: SunDirection.RISING,
+}
+
+# Custom conditions whose result only changes with the states of the entities
+# they reference.
+CACHEABLE_CONDITIONS = frozenset({"and", "or", "not", "state", "numeric_state"})
+
+
+def _condition_never_met(_hass: HomeAssistant, _variables: Any = None) -> bool:
+    """Stand in for a custom condition that failed to compile."""
+    return False
+
+
+def _is_cacheable(cfg: ConfigType) -> bool:
+    """Return whether the result of a custom condition can be cached.
+
+    Time, sun and template conditions, state durations and thresholds or values
+    read from other entities depend on the time or on entities that cannot be
+    extracted from the condition, so they are always evaluated.
+    """
+    if not isinstance(cfg, dict) or cfg.get(CONF_CONDITION) not in CACHEABLE_CONDITIONS:
+        return False
+    if CONF_FOR in cfg or CONF_VALUE_TEMPLATE in cfg:
+        return False
+    if isinstance(cfg.get(CONF_ABOVE), str) or isinstance(cfg.get(CONF_BELOW), str):
+        return False
+    conditions = cfg.get(CONF_CONDITIONS, [])
+    return all(
+        _is_cacheable(condition)
+        for condition in (conditions if isinstance(conditions, list) else [conditions])
+    )
+
+
+type ConditionGroup = Literal["forcing_conditions_met", "required_conditions_met"]
+
+
+class SceneConfigEvaluation(TypedDict, total=False):
+    """Result of evaluating the custom conditions of a scene config."""
+
+    scene_config: SceneConfig
+    forcing_conditions_met: bool
+    required_conditions_met: bool
+
+
+def _get_candidates(evaluations: list[SceneConfigEvaluation]) -> list[SceneConfig]:
+    """Return the scene configs that are candidates based on their evaluations.
+
+    Scene configs without a condition are only candidates while forced.
+    """
+    if forced_evaluations := [
+        evaluation
+        for evaluation in evaluations
+        if evaluation.get("forcing_conditions_met")
+    ]:
+        return [evaluation["scene_config"] for evaluation in forced_evaluations]
+
+    return [
+        evaluation["scene_config"]
+        for evaluation in evaluations
+        if evaluation["scene_config"].condition is not None
+        and (
+            evaluation.get("required_conditions_met")
+            or evaluation.get("required_conditions_met") is None
+        )
+    ]
+
 
 class SceneRouter:
     """Scene Router for managing scenes in Home Assistant."""
@@ -41,6 +141,23 @@ class SceneRouter:
             config_entry.options
         )
         self.condition_entities: dict[str, dict[ConditionType, Entity]] = {}
+        self.compiled_conditions: dict[str, condition_helper.ConditionCheckerType] = {}
+        self._condition_results: dict[str, tuple[bool, float]] = {}
+        self._condition_keys_by_entity_id: dict[str, set[str]] = {}
+        self._cacheable_condition_keys: set[str] = set()
+        self.has_time_dependent_conditions = False
+        self._timeline: SceneTimeline | None = None
+        self._next_scene_change: SceneTimelineChange | None = None
+        self._next_scene_change_valid_until: datetime | None = None
+        self._candidates: tuple[SceneConfig, ...] | None = None
+        self.stats = SceneRouterStats()
+        self.traces: deque[dict[str, Any]] = deque(maxlen=DEFAULT_TRACE_SIZE)
+        self.sun_elevation_cache: SunElevationCache = hass.data[DOMAIN][
+            DATA_SUN_ELEVATION_CACHE
+        ]
+        self.sun_table = self._create_sun_table()
+        self.lux_filter = LuxFilter()
+        self._lux_below: dict[str, float] = {}
 
         dr.async_get(hass).async_get_or_create(
             config_entry_id=config_entry.entry_id,
@@ -91,99 +208,434 @@ class SceneRouter:
         )
         return friendly_name
 
-    async def _evaluate_custom(self, cfg: dict[str, Any]) -> bool:
-        """Compile & evaluate a Home Assistant custom condition dict asynchronously."""
-        _LOGGER.debug(
-            "Evaluating custom condition: %s for scene: %s",
-            cfg,
-            self.scene_router_config.name,
+    @property
+    def referenced_entity_ids(self) -> set[str]:
+        """Return the entity IDs the selection of this scene router depends on."""
+        entity_ids: set[str] = set(self.scene_router_config.light_entities)
+        for scene_config in self.scene_router_config.scene_configs:
+            entity_ids.add(scene_config.scene)
+            for cfg in (
+                *scene_config.forcing_custom_conditions,
+                *scene_config.required_custom_conditions,
+            ):
+                try:
+                    entity_ids.update(condition_helper.async_extract_entities(cfg))
+                except (KeyError, TypeError) as e:
+                    _LOGGER.warning(
+                        "Could not extract entities from custom condition %s: %s",
+                        cfg,
+                        e,
+                    )
+        return entity_ids
+
+    async def _compile_custom(
+        self, cfg: ConfigType
+    ) -> condition_helper.ConditionCheckerType:
+        """Validate and compile a Home Assistant custom condition dict."""
+        config = cv.CONDITION_SCHEMA(cfg)
+        config = await condition_helper.async_validate_condition_config(
+            self.hass, config
         )
+        return await condition_helper.async_from_config(self.hass, config)
+
+    async def async_compile_conditions(self) -> None:
+        """Compile all custom conditions of the scene configs into the cache."""
+        self.compiled_conditions.clear()
+        self._condition_results.clear()
+        self._condition_keys_by_entity_id.clear()
+        self._cacheable_condition_keys.clear()
+        self.has_time_dependent_conditions = False
+        for scene_config in self.scene_router_config.scene_configs:
+            for key, cfg in (
+                *scene_config.keyed_forcing_custom_conditions,
+                *scene_config.keyed_required_custom_conditions,
+            ):
+                if not _is_cacheable(cfg):
+                    self.has_time_dependent_conditions = True
+                if key in self.compiled_conditions:
+                    continue
+                try:
+                    self.compiled_conditions[key] = await self._compile_custom(cfg)
+                except (vol.Invalid, HomeAssistantError) as e:
+                    _LOGGER.error(
+                        "Invalid custom condition %s for scene '%s' is never met: %s",
+                        cfg,
+                        scene_config.scene,
+                        e,
+                    )
+                    self.compiled_conditions[key] = _condition_never_met
+                    continue
+                self._index_cacheable_condition(key, cfg)
+
         _LOGGER.debug(
-            "cfg type: %s, cfg: %s",
-            type(cfg),
-            cfg,
+            "SceneRouter '%s' compiled %d custom conditions",
+            self.scene_router_config.name,
+            len(self.compiled_conditions),
         )
-        cfg = cv.CONDITION_SCHEMA(cfg)
-        config = await condition_helper.async_validate_condition_config(self.hass, cfg)
-        test = await condition_helper.async_from_config(self.hass, config)
+
+    def _index_cacheable_condition(self, key: str, cfg: ConfigType) -> None:
+        """Index a cacheable custom condition by the entities it references."""
+        if not _is_cacheable(cfg):
+            return
+        try:
+            entity_ids = condition_helper.async_extract_entities(cfg)
+        except (KeyError, TypeError):
+            return
+        self._cacheable_condition_keys.add(key)
+        for entity_id in entity_ids:
+            self._condition_keys_by_entity_id.setdefault(entity_id, set()).add(key)
+
+    def invalidate_condition_results(self, entity_id: str) -> None:
+        """Discard the cached results of the conditions referencing the entity."""
+        for key in self._condition_keys_by_entity_id.get(entity_id, ()):
+            self._condition_results.pop(key, None)
+
+    def _evaluate_custom(
+        self, key: str, cfg: ConfigType
+    ) -> bool | Coroutine[Any, Any, bool]:
+        """Evaluate a Home Assistant custom condition dict using the compiled cache.
+
+        Results of cacheable conditions are reused for the condition cache TTL
+        or until an entity the condition references changes. Compiled checkers
+        are called inline, a coroutine is only returned if the condition still
+        has to be compiled or its checker returned an awaitable.
+        """
+        if (cached := self._condition_results.get(key)) and cached[1] > monotonic():
+            self.stats.custom_condition_cache_hits += 1
+            return cached[0]
+
+        if not (test := self.compiled_conditions.get(key)):
+            return self._async_compile_and_evaluate(cfg, key)
+
+        self.stats.custom_conditions_evaluated += 1
         result = test(self.hass, {})
         if asyncio.iscoroutine(result):
-            result = await result
-        _LOGGER.debug(
-            "Custom condition result for scene '%s': %s",
-            self.scene_router_config.name,
-            result,
+            return self._async_cache_result(key, result)
+        return self._cache_result(key, bool(result))
+
+    async def _async_compile_and_evaluate(self, cfg: ConfigType, key: str) -> bool:
+        """Compile a custom condition missing from the cache and evaluate it."""
+        try:
+            test = await self._compile_custom(cfg)
+        except (vol.Invalid, HomeAssistantError) as e:
+            _LOGGER.error("Invalid custom condition %s is never met: %s", cfg, e)
+            test = _condition_never_met
+        self.compiled_conditions[key] = test
+
+        result = self._evaluate_custom(key, cfg)
+        return result if isinstance(result, bool) else await result
+
+    async def _async_cache_result(self, key: str, result: Awaitable[Any]) -> bool:
+        """Await the result of a custom condition and cache it."""
+        return self._cache_result(key, bool(await result))
+
+    def _cache_result(self, key: str, result: bool) -> bool:
+        """Cache the result of a cacheable custom condition."""
+        if (
+            key in self._cacheable_condition_keys
+            and (ttl := self.scene_router_config.condition_cache_ttl) > 0
+        ):
+            self._condition_results[key] = (result, monotonic() + ttl)
+        return result
+
+    def _evaluate_custom_group(
+        self,
+        keyed_cfgs: Sequence[tuple[str, ConfigType]],
+        semaphore: asyncio.Semaphore,
+        short_circuit: bool,
+    ) -> bool | Coroutine[Any, Any, bool]:
+        """Evaluate custom conditions until one evaluates to short_circuit.
+
+        Returns short_circuit as soon as one condition evaluates to it,
+        otherwise its negation. If awaitable results leave the group undecided,
+        a coroutine awaiting them concurrently is returned instead.
+        """
+        pending: list[Coroutine[Any, Any, bool]] = []
+        for key, cfg in keyed_cfgs:
+            result = self._evaluate_custom(key, cfg)
+            if not isinstance(result, bool):
+                pending.append(result)
+            elif result == short_circuit:
+                for coro in pending:
+                    coro.close()
+                return short_circuit
+
+        if not pending:
+            return not short_circuit
+        return self._async_evaluate_pending(pending, semaphore, short_circuit)
+
+    async def _async_evaluate_pending(
+        self,
+        pending: list[Coroutine[Any, Any, bool]],
+        semaphore: asyncio.Semaphore,
+        short_circuit: bool,
+    ) -> bool:
+        """Await the pending results of a group of custom conditions concurrently.
+
+        Returns short_circuit as soon as one result is it and cancels the
+        results still pending, otherwise returns its negation.
+        """
+
+        async def _evaluate(coro: Coroutine[Any, Any, bool]) -> bool:
+            try:
+                async with semaphore:
+                    return await coro
+            finally:
+                coro.close()
+
+        tasks = [asyncio.create_task(_evaluate(coro)) for coro in pending]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                if await next_result == short_circuit:
+                    return short_circuit
+            return not short_circuit
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _async_evaluate_scene_configs(self) -> list[SceneConfigEvaluation]:
+        """Evaluate the custom conditions of all scene configs in one batch.
+
+        Condition groups left undecided by awaitable results are awaited
+        concurrently. If one of them raises, the ones still pending are
+        cancelled.
+        """
+        semaphore = asyncio.Semaphore(
+            self.scene_router_config.max_concurrent_conditions
         )
-        return bool(result)
+        evaluations: list[SceneConfigEvaluation] = []
+        pending: list[
+            tuple[SceneConfigEvaluation, ConditionGroup, Coroutine[Any, Any, bool]]
+        ] = []
+        for scene_config in self.scene_router_config.scene_configs:
+            evaluation: SceneConfigEvaluation = {"scene_config": scene_config}
+            groups: tuple[
+                tuple[ConditionGroup, tuple[tuple[str, ConfigType], ...], bool], ...
+            ] = (
+                (
+                    "forcing_conditions_met",
+                    scene_config.keyed_forcing_custom_conditions,
+                    True,
+                ),
+                (
+                    "required_conditions_met",
+                    scene_config.keyed_required_custom_conditions,
+                    False,
+                ),
+            )
+            for name, keyed_cfgs, short_circuit in groups:
+                if not keyed_cfgs:
+                    continue
+                result = self._evaluate_custom_group(
+                    keyed_cfgs, semaphore, short_circuit
+                )
+                if isinstance(result, bool):
+                    evaluation[name] = result
+                else:
+                    pending.append((evaluation, name, result))
+            evaluations.append(evaluation)
+
+        if not pending:
+            return evaluations
+
+        tasks = [asyncio.create_task(coro) for _, _, coro in pending]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        for (evaluation, name, _), result in zip(pending, results, strict=True):
+            evaluation[name] = result
+        return evaluations
 
     @property
     async def scene_config_candidates(self) -> list[SceneConfig]:
         """Return a list of scene configurations that are candidates for selection."""
+        return _get_candidates(await self._async_evaluate_scene_configs())
+
+    async def async_apply_config(self, scene_router_config: SceneRouterConfig) -> None:
+        """Hot-swap the scene router config without reloading the entry."""
+        self.scene_router_config = scene_router_config
+        if scene_router_config.enable_sun_table != (self.sun_table is not None):
+            self.sun_table = self._create_sun_table()
+        await self.async_compile_conditions()
+        self._candidates = None
+        self.invalidate_timeline()
+
+    def _create_sun_table(self) -> SunTable | None:
+        """Return the sun table of this scene router if it is enabled."""
+        if not self.scene_router_config.enable_sun_table:
+            return None
+        return SunTable(
+            self.hass.data[DOMAIN][DATA_STORE],
+            f"{self.config_entry.entry_id}_sun_table",
+        )
 
-        class SceneConfigEvaluation(TypedDict):
-            scene_config: SceneConfig
-            forcing_conditions_met: bool | None = None
-            required_conditions_met: bool | None = None
+    async def _async_update_sun_table(
+        self, now_dt: datetime, location: Location | None = None
+    ) -> None:
+        """Make the sun table hold the rows of the current elevation thresholds."""
+        if self.sun_table is None:
+            return
 
-        evaluations: list[SceneConfigEvaluation] = []
+        row_keys: list[tuple[float, SunDirection]] = []
         for scene_config in self.scene_router_config.scene_configs:
-            evaluation: SceneConfigEvaluation = {
-                "scene_config": scene_config,
-            }
-
-            if scene_config.forcing_custom_conditions:
-                results = await asyncio.gather(
-                    *(
-                        self._evaluate_custom(cond)
-                        for cond in scene_config.forcing_custom_conditions
-                    )
-                )
-                evaluation["forcing_conditions_met"] = any(results)
-
-            if scene_config.required_custom_conditions:
-                results = await asyncio.gather(
-                    *(
-                        self._evaluate_custom(cond)
-                        for cond in scene_config.required_custom_conditions
-                    )
-                )
-                evaluation["required_conditions_met"] = all(results)
-
-            evaluations.append(evaluation)
+            if not (direction := SUN_DIRECTIONS.get(scene_config.condition)) or not (
+                condition_entity := self.condition_entities.get(
+                    scene_config.scene, {}
+                ).get(scene_config.condition)
+            ):
+                continue
+            try:
+                row_keys.append((float(condition_entity.state), direction))
+            except (TypeError, ValueError):
+                continue
 
-        if forced_evaluations := [
-            evaluation
-            for evaluation in evaluations
-            if evaluation.get("forcing_conditions_met")
-        ]:
-            return [evaluation["scene_config"] for evaluation in forced_evaluations]
+        if location is None:
+            location, _ = get_astral_location(self.hass)
+        await self.sun_table.async_update(
+            self.hass, location.observer, now_dt.tzinfo, row_keys
+        )
 
-        return [
-            evaluation["scene_config"]
-            for evaluation in evaluations
-            if evaluation.get("required_conditions_met")
-            or evaluation.get("required_conditions_met") is None
-        ]
+    def _time_at_elevation(
+        self,
+        observer: Observer,
+        elevation: float,
+        day: date,
+        direction: SunDirection,
+        tz: tzinfo,
+    ) -> datetime:
+        """Return the sun crossing time, preferring the precomputed sun table.
+
+        Raises ValueError if the sun never reaches the elevation on that day.
+        """
+        if self.sun_table is not None and (
+            crossing := self.sun_table.time_at_elevation(elevation, day, direction, tz)
+        ):
+            return crossing
+        return self.sun_elevation_cache.time_at_elevation(
+            observer, elevation, day, direction, tz
+        )
 
-    @property
-    async def selected_scene(self) -> tuple[str, str] | None:
-        """Asynchronously select the best scene based on required, forcing, and builtin conditions."""
-        candidates = await self.scene_config_candidates
-        if not candidates:
-            _LOGGER.warning(
-                "SceneRouter '%s' has no valid scene candidates",
-                self.scene_router_config.name,
+    def update_lux_states(self) -> bool:
+        """Compare the smoothed illuminance with the LUX_BELOW thresholds.
+
+        Returns whether any scene config crossed its threshold, taking the
+        hysteresis band into account.
+        """
+        lux_below: dict[str, float] = {}
+        if (value := self.lux_filter.value) is not None:
+            for scene_config in self.scene_router_config.scene_configs:
+                if scene_config.condition != ConditionType.LUX_BELOW or not (
+                    condition_entity := self.condition_entities.get(
+                        scene_config.scene, {}
+                    ).get(scene_config.condition)
+                ):
+                    continue
+                try:
+                    threshold = float(condition_entity.state)
+                except (TypeError, ValueError):
+                    continue
+                if is_below(
+                    value,
+                    threshold,
+                    self.scene_router_config.lux_hysteresis,
+                    scene_config.scene in self._lux_below,
+                ):
+                    lux_below[scene_config.scene] = threshold
+
+        changed = lux_below.keys() != self._lux_below.keys()
+        self._lux_below = lux_below
+        if changed:
+            self._next_scene_change_valid_until = None
+        return changed
+
+    def invalidate_timeline(self) -> None:
+        """Discard the cached timeline so it is rebuilt on the next selection."""
+        self._timeline = None
+        self._next_scene_change_valid_until = None
+
+    def get_timeline(
+        self, now_dt: datetime, location: Location | None = None
+    ) -> SceneTimeline:
+        """Return the timeline for the day of the given datetime."""
+        if self._timeline is None or self._timeline.date != now_dt.date():
+            self._timeline = self._build_timeline(now_dt, location)
+        return self._timeline
+
+    def next_timeline_change_at(self, now_dt: datetime) -> datetime:
+        """Return when the timeline changes next, falling back to next midnight."""
+        next_midnight = dt_util.start_of_local_day(now_dt.date() + timedelta(days=1))
+        next_change_at = self.get_timeline(now_dt).next_change_at(now_dt)
+        if next_change_at and next_change_at < next_midnight:
+            return next_change_at
+        return next_midnight
+
+    def next_scene_change(self, now_dt: datetime) -> SceneTimelineChange | None:
+        """Return when the selection next switches to another scene.
+
+        The change is looked up among the candidates of the last selection. The
+        result is kept until that change is reached, the timeline is invalidated
+        or the candidates or illuminance states change.
+        """
+        if (
+            self._next_scene_change_valid_until is None
+            or now_dt >= self._next_scene_change_valid_until
+        ):
+            self._next_scene_change = self._find_next_scene_change(now_dt)
+            self._next_scene_change_valid_until = (
+                self._next_scene_change.at
+                if self._next_scene_change
+                else dt_util.start_of_local_day(now_dt.date() + timedelta(days=1))
             )
+        return self._next_scene_change
+
+    def _find_next_scene_change(self, now_dt: datetime) -> SceneTimelineChange | None:
+        """Search the rest of today and tomorrow for the next change of scene.
+
+        While a forced scene config without a condition or a LUX_BELOW scene
+        config overrides the timeline, no change can be predicted.
+        """
+        candidates = self._candidates
+        if candidates is not None and (
+            not candidates
+            or any(
+                candidate.condition is None or candidate.scene in self._lux_below
+                for candidate in candidates
+            )
+        ):
             return None
-        now_dt = dt_util.now()
-
-        class SceneConfigTimelinePoint(TypedDict):
-            scene_config: SceneConfig
-            from_time: time | None
-            to_time: time | None
 
-        scene_config_timeline_points: list[SceneConfigTimelinePoint] = []
-        for scene_config in candidates:
+        timeline = self.get_timeline(now_dt)
+        active_point = timeline.active_point(now_dt.time(), candidates)
+        active_scene = active_point.scene_config.scene if active_point else None
+        tomorrow_dt = dt_util.start_of_local_day(now_dt.date() + timedelta(days=1))
+
+        for day_timeline, after in (
+            (timeline, now_dt.time()),
+            (self._build_timeline(tomorrow_dt), None),
+        ):
+            for change_time in day_timeline.change_times(after):
+                point = day_timeline.active_point(change_time, candidates)
+                if (point.scene_config.scene if point else None) != active_scene:
+                    return SceneTimelineChange(
+                        datetime.combine(
+                            day_timeline.date, change_time, tzinfo=now_dt.tzinfo
+                        ),
+                        point.scene_config if point else None,
+                    )
+        return None
+
+    def _build_timeline(
+        self, now_dt: datetime, location: Location | None = None
+    ) -> SceneTimeline:
+        """Build the timeline of all scene configs for the day of the given datetime."""
+        if location is None:
+            location, _ = get_astral_location(self.hass)
+        points: list[SceneTimelinePoint] = []
+        for scene_config in self.scene_router_config.scene_configs:
+            if scene_config.condition is None:
+                continue
             if not (
                 condition_entity := self.condition_entities.get(
                     scene_config.scene, {}
@@ -205,29 +657,32 @@ class SceneRouter:
                 continue
 
             match scene_config.condition:
-                case ConditionType.TIME_AFTER:
-                    scene_config_timeline_points.append(
-                        {
-                            "scene_config": scene_config,
-                            "from_time": dt_util.parse_time(condition_state),
-                        }
-                    )
-                case ConditionType.SUN_BELOW:
+                case ConditionType.TIME_AFTER | ConditionType.TIME_BEFORE:
+                    if not (condition_time := dt_util.parse_time(condition_state)):
+                        _LOGGER.error(
+                            "Invalid time '%s' for scene '%s'",
+                            condition_state,
+                            scene_config.scene,
+                        )
+                        continue
+                    if scene_config.condition == ConditionType.TIME_AFTER:
+                        points.append(SceneTimelinePoint(condition_time, scene_config))
+                    else:
+                        points.append(
+                            SceneTimelinePoint(time.min, scene_config, condition_time)
+                        )
+                case ConditionType.SUN_BELOW | ConditionType.SUN_ABOVE:
                     try:
                         threshold = float(condition_state)
-                        location, _ = get_astral_location(self.hass)
-                        elevation_dt = time_at_elevation(
+                        elevation_dt = self._time_at_elevation(
                             location.observer,
                             threshold,
-                            date=now_dt.date(),
-                            direction=SunDirection.SETTING,
-                            tzinfo=now_dt.tzinfo,
+                            now_dt.date(),
+                            SUN_DIRECTIONS[scene_config.condition],
+                            now_dt.tzinfo,
                         )
-                        scene_config_timeline_points.append(
-                            {
-                                "scene_config": scene_config,
-                                "from_time": elevation_dt.timetz(),
-                            }
+                        points.append(
+                            SceneTimelinePoint(elevation_dt.time(), scene_config)
                         )
                     except ValueError as e:
                         _LOGGER.error(
@@ -238,26 +693,160 @@ class SceneRouter:
                         )
                         continue
 
-        scene_config_timeline_points.sort(key=lambda x: (x["from_time"]))
+        _LOGGER.debug(
+            "SceneRouter '%s' built timeline for %s with %d points",
+            self.scene_router_config.name,
+            now_dt.date(),
+            len(points),
+        )
+        return SceneTimeline(now_dt.date(), points)
+
+    @property
+    async def selected_scene(self) -> tuple[str, str] | None:
+        """Asynchronously select the best scene based on required, forcing, and builtin conditions."""
+        return await self.async_select_scene()
+
+    async def async_select_scene(
+        self, now_dt: datetime | None = None, location: Location | None = None
+    ) -> tuple[str, str] | None:
+        """Select the best scene at the given time, defaulting to now.
+
+        The location defaults to the current home location.
+        """
+        now_dt = now_dt or dt_util.now()
+        await self._async_update_sun_table(now_dt, location)
+        evaluations = await self._async_evaluate_scene_configs()
+        candidates = _get_candidates(evaluations)
+        self._set_candidates(candidates)
+        selected_scene = self._select_scene(candidates, now_dt, location)
+
+        if self.scene_router_config.enable_evaluation_trace:
+            self._record_trace(now_dt, evaluations, candidates, selected_scene)
+
+        return selected_scene
+
+    def _set_candidates(self, candidates: list[SceneConfig]) -> None:
+        """Remember the candidates, discarding the next scene change on changes."""
+        if (
+            self._candidates is None
+            or len(self._candidates) != len(candidates)
+            or any(
+                previous is not candidate
+                for previous, candidate in zip(
+                    self._candidates, candidates, strict=True
+                )
+            )
+        ):
+            self._candidates = tuple(candidates)
+            self._next_scene_change_valid_until = None
+
+    async def async_preview(self, datetimes: Sequence[datetime]) -> list[str | None]:
+        """Return the scene the timeline selects at each datetime.
+
+        The custom conditions are evaluated once with the current states and the
+        illuminance is not taken into account. The cached timeline and the
+        evaluation traces are left untouched.
+        """
+        datetimes = [dt_util.as_local(at) for at in datetimes]
+        if not datetimes:
+            return []
+
+        await self._async_update_sun_table(datetimes[0])
+        candidates = _get_candidates(await self._async_evaluate_scene_configs())
+        if not candidates:
+            return [None] * len(datetimes)
+        if forced_candidates := [
+            candidate for candidate in candidates if candidate.condition is None
+        ]:
+            return [forced_candidates[0].scene] * len(datetimes)
+
+        def _build_timeline(at: datetime) -> SceneTimeline:
+            if self._timeline is not None and self._timeline.date == at.date():
+                return self._timeline
+            return self._build_timeline(at)
+
+        return [
+            point.scene_config.scene if point else None
+            for point in preview_timeline(datetimes, _build_timeline, candidates)
+        ]
 
-        if not scene_config_timeline_points:
+    def _record_trace(
+        self,
+        now_dt: datetime,
+        evaluations: list[SceneConfigEvaluation],
+        candidates: list[SceneConfig],
+        selected_scene: tuple[str, str] | None,
+    ) -> None:
+        """Append the evaluation to the trace buffer."""
+        self.traces.append(
+            {
+                "evaluated_at": now_dt.isoformat(),
+                "evaluations": [
+                    {
+                        "scene": evaluation["scene_config"].scene,
+                        "forcing_conditions_met": evaluation.get(
+                            "forcing_conditions_met"
+                        ),
+                        "required_conditions_met": evaluation.get(
+                            "required_conditions_met"
+                        ),
+                    }
+                    for evaluation in evaluations
+                ],
+                "candidates": [candidate.scene for candidate in candidates],
+                "timeline": [
+                    {
+                        "scene": point.scene_config.scene,
+                        "from_time": point.from_time.isoformat(),
+                        "to_time": point.to_time.isoformat() if point.to_time else None,
+                    }
+                    for point in (self._timeline.points if self._timeline else [])
+                ],
+                "selected_scene": selected_scene[0] if selected_scene else None,
+            }
+        )
+
+    def _select_scene(
+        self,
+        candidates: list[SceneConfig],
+        now_dt: datetime,
+        location: Location | None = None,
+    ) -> tuple[str, str] | None:
+        """Select the scene active on the timeline among the candidates.
+
+        A forced scene config without a condition takes precedence, as it has no
+        place on the timeline. Next, a LUX_BELOW scene config whose threshold the
+        illuminance is below takes precedence over the timeline, the one with the
+        lowest threshold first.
+        """
+        if not candidates:
             _LOGGER.warning(
-                "SceneRouter '%s' has no valid scene configurations with conditions",
+                "SceneRouter '%s' has no valid scene candidates",
                 self.scene_router_config.name,
             )
             return None
 
-        matched_scene_configs: list[SceneConfig] = [
-            scene_config_timeline_point["scene_config"]
-            for scene_config_timeline_point in scene_config_timeline_points
-            if now_dt.timetz() >= scene_config_timeline_point["from_time"]
-        ]
-
-        matched_scene_config: SceneConfig
-        if not matched_scene_configs:
-            matched_scene_config = scene_config_timeline_points[-1]["scene_config"]
+        self.update_lux_states()
+        if forced_candidates := [
+            candidate for candidate in candidates if candidate.condition is None
+        ]:
+            matched_scene_config = forced_candidates[0]
+        elif lux_candidates := [
+            candidate for candidate in candidates if candidate.scene in self._lux_below
+        ]:
+            matched_scene_config = min(
+                lux_candidates, key=lambda candidate: self._lux_below[candidate.scene]
+            )
+        elif point := self.get_timeline(now_dt, location).active_point(
+            now_dt.time(), candidates
+        ):
+            matched_scene_config = point.scene_config
         else:
-            matched_scene_config = matched_scene_configs[-1]
+            _LOGGER.warning(
+                "SceneRouter '%s' has no valid scene configurations with conditions",
+                self.scene_router_config.name,
+            )
+            return None
 
         scene_state = self.hass.states.get(matched_scene_config.scene)
         scene_entity_id = matched_scene_config.scene
@@ -0,0 +1,112 @@
+"""Shared evaluation scheduler for the Scene Router integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import random
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from astral.location import Location
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.sun import get_astral_location
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_SCHEDULER_JITTER_SECONDS, DEFAULT_UPDATE_INTERVAL_SECONDS
+
+if TYPE_CHECKING:
+    from .coordinator import SceneRouterCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SceneRouterScheduler:
+    """Single timer driving the periodic evaluation of all scene routers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the SceneRouterScheduler."""
+        self.hass = hass
+        self._coordinators: dict[str, SceneRouterCoordinator] = {}
+        self._running: set[str] = set()
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Start the shared tick."""
+        self._unsub_tick = async_track_time_interval(
+            self.hass,
+            self._handle_tick,
+            timedelta(seconds=DEFAULT_UPDATE_INTERVAL_SECONDS),
+            name=f"{__name__} tick",
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the shared tick."""
+        if self._unsub_tick:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def async_register(
+        self, entry_id: str, coordinator: SceneRouterCoordinator
+    ) -> CALLBACK_TYPE:
+        """Register a coordinator to be evaluated by the shared tick."""
+        self._coordinators[entry_id] = coordinator
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.pop(entry_id, None)
+
+        return _unregister
+
+    @callback
+    def _handle_tick(self, _now: datetime) -> None:
+        """Evaluate all scene routers that are due in one batch.
+
+        All routers of the batch are evaluated at the same time and location.
+        Entity states are read when each router is evaluated.
+        """
+        now = monotonic()
+        due = [
+            (entry_id, coordinator)
+            for entry_id, coordinator in self._coordinators.items()
+            if entry_id not in self._running and coordinator.is_due(now)
+        ]
+        if not due:
+            return
+
+        _LOGGER.debug("Scene Router scheduler evaluating %d routers", len(due))
+        now_dt = dt_util.now()
+        location, _ = get_astral_location(self.hass)
+        for entry_id, coordinator in due:
+            self._running.add(entry_id)
+            self.hass.async_create_background_task(
+                self._async_refresh(
+                    entry_id,
+                    coordinator,
+                    now_dt,
+                    location,
+                    random.uniform(0, DEFAULT_SCHEDULER_JITTER_SECONDS),
+                ),
+                f"{__name__} refresh {coordinator.name}",
+            )
+
+    async def _async_refresh(
+        self,
+        entry_id: str,
+        coordinator: SceneRouterCoordinator,
+        now_dt: datetime,
+        location: Location,
+        delay: float,
+    ) -> None:
+        """Refresh a single coordinator after its jitter delay."""
+        try:
+            await asyncio.sleep(delay)
+            await coordinator.async_scheduled_refresh(now_dt, location)
+        finally:
+            self._running.discard(entry_id)
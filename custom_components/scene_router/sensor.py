@@ -2,22 +2,30 @@
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime
 import logging
 from typing import Any
 
 from homeassistant.components.sensor import (
     EntityCategory,
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
+from homeassistant.const import UnitOfTime
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
 
 from .const import DATA_COORDINATORS, DATA_SCENE_ROUTERS, DOMAIN
 from .coordinator import SceneRouterCoordinator
 from .entity import SceneRouterEntity, SceneRouterEntityDescription
 from .scene_router import SceneRouter
+from .stats import SceneRouterStats
+from .timeline import SceneTimelineChange
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +39,24 @@ class SceneRouterSensorEntityDescription(
     value_func: Callable[[tuple[str, str]], str]
 
 
+@dataclass(frozen=True, kw_only=True)
+class SceneRouterStatsSensorEntityDescription(
+    SceneRouterEntityDescription, SensorEntityDescription
+):
+    """Class describing Scene Router evaluation statistics sensor entities."""
+
+    value_func: Callable[[SceneRouterStats], float | int | None]
+
+
+@dataclass(frozen=True, kw_only=True)
+class SceneRouterNextChangeSensorEntityDescription(
+    SceneRouterEntityDescription, SensorEntityDescription
+):
+    """Class describing Scene Router upcoming scene change sensor entities."""
+
+    value_func: Callable[[SceneTimelineChange], datetime | str | None]
+
+
 ENTITY_DESCRIPTIONS = [
     SceneRouterSensorEntityDescription(
         key="selected_scene",
@@ -47,6 +73,86 @@ ENTITY_DESCRIPTIONS = [
 ]
 
 
+NEXT_CHANGE_ENTITY_DESCRIPTIONS = [
+    SceneRouterNextChangeSensorEntityDescription(
+        key="next_scene",
+        translation_key="next_scene",
+        value_func=lambda change: (
+            change.scene_config.scene if change.scene_config else None
+        ),
+    ),
+    SceneRouterNextChangeSensorEntityDescription(
+        key="next_change_at",
+        translation_key="next_change_at",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_func=lambda change: change.at,
+    ),
+]
+
+
+def _to_milliseconds(seconds: float | None) -> float | None:
+    """Convert a duration in seconds to milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+STATS_ENTITY_DESCRIPTIONS = [
+    SceneRouterStatsSensorEntityDescription(
+        key="evaluations",
+        translation_key="evaluations",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_func=lambda stats: stats.evaluations,
+    ),
+    SceneRouterStatsSensorEntityDescription(
+        key="custom_conditions_evaluated",
+        translation_key="custom_conditions_evaluated",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_func=lambda stats: stats.custom_conditions_evaluated,
+    ),
+    SceneRouterStatsSensorEntityDescription(
+        key="custom_condition_cache_hits",
+        translation_key="custom_condition_cache_hits",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_func=lambda stats: stats.custom_condition_cache_hits,
+    ),
+    SceneRouterStatsSensorEntityDescription(
+        key="evaluation_latency_p50",
+        translation_key="evaluation_latency_p50",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_func=lambda stats: _to_milliseconds(stats.percentile(50)),
+    ),
+    SceneRouterStatsSensorEntityDescription(
+        key="evaluation_latency_p95",
+        translation_key="evaluation_latency_p95",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_func=lambda stats: _to_milliseconds(stats.percentile(95)),
+    ),
+    SceneRouterStatsSensorEntityDescription(
+        key="last_evaluation_duration",
+        translation_key="last_evaluation_duration",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_func=lambda stats: _to_milliseconds(stats.last_evaluation_duration),
+    ),
+]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -63,6 +169,18 @@ async def async_setup_entry(
         )
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        SceneRouterStatsSensorEntity(
+            config_entry, scene_router, coordinator, entity_description
+        )
+        for entity_description in STATS_ENTITY_DESCRIPTIONS
+    )
+    async_add_entities(
+        SceneRouterNextChangeSensorEntity(
+            config_entry, scene_router, coordinator, entity_description
+        )
+        for entity_description in NEXT_CHANGE_ENTITY_DESCRIPTIONS
+    )
 
 
 class SceneRouterSensorEntity(SceneRouterEntity, SensorEntity):
@@ -86,3 +204,66 @@ class SceneRouterSensorEntity(SceneRouterEntity, SensorEntity):
         """Return the state of the sensor."""
 
         return self._value
+
+
+class SceneRouterStatsSensorEntity(SceneRouterEntity, SensorEntity):
+    """Evaluation statistics sensor entity for Scene Router integration."""
+
+    entity_description: SceneRouterStatsSensorEntityDescription
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the state of the sensor."""
+        return self.entity_description.value_func(self.scene_router.stats)
+
+
+class SceneRouterNextChangeSensorEntity(SceneRouterEntity, SensorEntity):
+    """Upcoming scene change sensor entity for Scene Router integration.
+
+    The value comes from the scene router's timeline and is refreshed when the
+    change is reached or the coordinator updates, never by polling.
+    """
+
+    entity_description: SceneRouterNextChangeSensorEntityDescription
+    _unsub_next_change: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the next change once the entity is added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_next_change)
+        self._async_update_next_change()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updates from the coordinator."""
+        self._async_update_next_change()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_next_change(self, _now: datetime) -> None:
+        """Move on to the following change once the next change is reached."""
+        self._unsub_next_change = None
+        self._async_update_next_change()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_update_next_change(self) -> None:
+        """Update the value and track the point in time of the next change."""
+        self._async_cancel_next_change()
+
+        change = self.scene_router.next_scene_change(dt_util.now())
+        if change is None:
+            self._attr_native_value = None
+            return
+
+        self._attr_native_value = self.entity_description.value_func(change)
+        self._unsub_next_change = async_track_point_in_time(
+            self.hass, self._handle_next_change, change.at
+        )
+
+    @callback
+    def _async_cancel_next_change(self) -> None:
+        """Stop tracking the next change."""
+        if self._unsub_next_change:
+            self._unsub_next_change()
+            self._unsub_next_change = None
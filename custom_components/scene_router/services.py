@@ -0,0 +1,214 @@
+"""Services for the Scene Router integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import logging
+
+import voluptuous as vol
+
+from homeassistant.components.scene import DOMAIN as SCENE_DOMAIN
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DATA_COORDINATORS,
+    DEFAULT_MAX_CONCURRENT_ACTIVATIONS,
+    DEFAULT_MAX_PREVIEW_SAMPLES,
+    DEFAULT_PREVIEW_INTERVAL_SECONDS,
+    DOMAIN,
+    SERVICE_ACTIVATE,
+    SERVICE_PREVIEW,
+    SIGNAL_SCENE_APPLIED,
+)
+from .coordinator import SceneRouterCoordinator
+from .scene_diff import SceneApplication
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_DATETIMES = "datetimes"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_INTERVAL = "interval"
+
+ACTIVATE_SCHEMA = cv.make_entity_service_schema({})
+PREVIEW_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Exclusive(ATTR_DATETIMES, "samples"): vol.All(
+            cv.ensure_list, [cv.datetime]
+        ),
+        vol.Exclusive(ATTR_START, "samples"): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(
+            ATTR_INTERVAL, default=timedelta(seconds=DEFAULT_PREVIEW_INTERVAL_SECONDS)
+        ): cv.time_period,
+    }
+)
+
+
+def _get_preview_datetimes(call: ServiceCall) -> list[datetime]:
+    """Return the datetimes to preview, one local day from midnight by default."""
+    if ATTR_DATETIMES in call.data:
+        datetimes = [dt_util.as_local(at) for at in call.data[ATTR_DATETIMES]]
+    else:
+        start = dt_util.as_local(
+            call.data.get(ATTR_START) or dt_util.start_of_local_day()
+        )
+        end = dt_util.as_local(call.data.get(ATTR_END) or start + timedelta(days=1))
+        interval: timedelta = call.data[ATTR_INTERVAL]
+        if interval <= timedelta(0):
+            raise ServiceValidationError(f"Interval of {call.service} must be positive")
+        datetimes: list[datetime] = []
+        at = start
+        while at < end and len(datetimes) <= DEFAULT_MAX_PREVIEW_SAMPLES:
+            datetimes.append(at)
+            at += interval
+
+    if len(datetimes) > DEFAULT_MAX_PREVIEW_SAMPLES:
+        raise ServiceValidationError(
+            f"{call.service} is limited to {DEFAULT_MAX_PREVIEW_SAMPLES} datetimes"
+        )
+    return datetimes
+
+
+@callback
+def _async_get_targeted_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> dict[str, SceneRouterCoordinator]:
+    """Return the coordinators of the targeted scene routers by scene entity ID."""
+    coordinators: dict[str, SceneRouterCoordinator] = hass.data.get(DOMAIN, {}).get(
+        DATA_COORDINATORS, {}
+    )
+    entity_registry = er.async_get(hass)
+    referenced = async_extract_referenced_entity_ids(hass, call)
+
+    targeted: dict[str, SceneRouterCoordinator] = {}
+    for entity_id in referenced.referenced | referenced.indirectly_referenced:
+        if (
+            (entry := entity_registry.async_get(entity_id))
+            and entry.platform == DOMAIN
+            and entry.domain == SCENE_DOMAIN
+            and (coordinator := coordinators.get(entry.config_entry_id))
+            and coordinator not in targeted.values()
+        ):
+            targeted[entity_id] = coordinator
+
+    if not targeted:
+        raise ServiceValidationError(
+            f"No loaded scene router matches the target of {call.service}"
+        )
+    return targeted
+
+
+async def async_activate_coordinators(
+    hass: HomeAssistant, coordinators: Iterable[SceneRouterCoordinator]
+) -> None:
+    """Apply the selected scenes of many scene routers with batched service calls."""
+    coordinators = list(coordinators)
+    semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_ACTIVATIONS)
+
+    async def _async_get_selected_scene(
+        coordinator: SceneRouterCoordinator,
+    ) -> tuple[str, str] | None:
+        async with semaphore:
+            return await coordinator.async_get_selected_scene()
+
+    for coordinator in coordinators:
+        coordinator.activating = True
+    try:
+        selected_scenes = await asyncio.gather(
+            *(_async_get_selected_scene(coordinator) for coordinator in coordinators)
+        )
+
+        applied: list[tuple[SceneRouterCoordinator, str]] = []
+        for coordinator, selected_scene in zip(
+            coordinators, selected_scenes, strict=True
+        ):
+            if not selected_scene:
+                _LOGGER.warning("SceneRouter '%s' returned no scene", coordinator.name)
+                continue
+            applied.append((coordinator, selected_scene[0]))
+
+        if not applied:
+            return
+
+        scene_application = SceneApplication()
+        for coordinator, target in applied:
+            scene_router_config = coordinator.scene_router.scene_router_config
+            scene_application.add_scene(
+                hass,
+                target,
+                scene_router_config.light_entities,
+                scene_router_config.enable_light_diffing,
+                scene_router_config.transition or None,
+            )
+        await asyncio.gather(
+            *(
+                hass.services.async_call(domain, service, data, blocking=True)
+                for domain, service, data in scene_application.service_calls()
+            )
+        )
+        for coordinator, target in applied:
+            async_dispatcher_send(
+                hass,
+                f"{DOMAIN}_{coordinator.config_entry.entry_id}_{SIGNAL_SCENE_APPLIED}",
+                target,
+            )
+    finally:
+        for coordinator in coordinators:
+            coordinator.activating = False
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Scene Router services."""
+
+    async def _async_activate(call: ServiceCall) -> None:
+        """Activate the scenes selected by the targeted scene routers."""
+        await async_activate_coordinators(
+            hass, _async_get_targeted_coordinators(hass, call).values()
+        )
+
+    async def _async_preview(call: ServiceCall) -> ServiceResponse:
+        """Return the scenes the targeted scene routers select at the datetimes."""
+        coordinators = _async_get_targeted_coordinators(hass, call)
+        datetimes = _get_preview_datetimes(call)
+
+        scenes = await asyncio.gather(
+            *(
+                coordinator.scene_router.async_preview(datetimes)
+                for coordinator in coordinators.values()
+            )
+        )
+        return {
+            entity_id: {
+                "scenes": [
+                    {"at": at.isoformat(), "scene": scene}
+                    for at, scene in zip(datetimes, router_scenes, strict=True)
+                ]
+            }
+            for entity_id, router_scenes in zip(coordinators, scenes, strict=True)
+        }
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_ACTIVATE, _async_activate, schema=ACTIVATE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PREVIEW,
+        _async_preview,
+        schema=PREVIEW_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,33 @@
+"""Evaluation statistics for the Scene Router integration."""
+
+from __future__ import annotations
+
+from collections import deque
+
+from .const import DEFAULT_STATS_WINDOW_SIZE
+
+
+class SceneRouterStats:
+    """Counters and latency window of the evaluations of a scene router."""
+
+    def __init__(self, window_size: int = DEFAULT_STATS_WINDOW_SIZE) -> None:
+        """Initialize the SceneRouterStats."""
+        self.evaluations = 0
+        self.custom_conditions_evaluated = 0
+        self.custom_condition_cache_hits = 0
+        self.last_evaluation_duration: float | None = None
+        self._durations: deque[float] = deque(maxlen=window_size)
+
+    def record_evaluation(self, duration: float) -> None:
+        """Record the duration of an evaluation in seconds."""
+        self.evaluations += 1
+        self.last_evaluation_duration = duration
+        self._durations.append(duration)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the given percentile of the recent evaluation durations."""
+        if not self._durations:
+            return None
+        durations = sorted(self._durations)
+        index = round(percent / 100 * (len(durations) - 1))
+        return durations[index]
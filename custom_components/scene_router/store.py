@@ -0,0 +1,60 @@
+"""Storage for the Scene Router integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY_SECONDS, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SceneRouterStore:
+    """Write-through in-memory cache of the integration store."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the SceneRouterStore."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, key=DOMAIN, version=STORAGE_VERSION
+        )
+        self._data: dict[str, Any] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored data into memory."""
+        if (data := await self._store.async_load()) is None:
+            _LOGGER.debug("No stored data found, initializing empty data")
+            data = {}
+        self._data = data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the stored value for the key."""
+        return self._data.get(key, default)
+
+    @callback
+    def async_set(self, key: str, value: Any) -> None:
+        """Set the value for the key and schedule a debounced save."""
+        if key in self._data and self._data[key] == value:
+            return
+
+        self._data[key] = value
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY_SECONDS)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to be written to disk."""
+        self._save_pending = False
+        return self._data
+
+    async def async_flush(self) -> None:
+        """Write pending changes to disk immediately."""
+        if not self._save_pending:
+            return
+
+        self._save_pending = False
+        await self._store.async_save(self._data)
@@ -0,0 +1,129 @@
+"""Shared sun elevation cache for the Scene Router integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import date, datetime, tzinfo
+import logging
+from typing import NamedTuple
+
+from astral import Observer
+from astral.sun import SunDirection, time_at_elevation
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import DEFAULT_SUN_ELEVATION_CACHE_SIZE, DOMAIN, SIGNAL_LOCATION_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+type SunElevationCacheKey = tuple[
+    float, float, float, date, float, SunDirection, tzinfo
+]
+
+
+class SunElevationCacheInfo(NamedTuple):
+    """Statistics of the sun elevation cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SunElevationCache:
+    """Bounded LRU cache for sun elevation crossing times."""
+
+    def __init__(self, maxsize: int = DEFAULT_SUN_ELEVATION_CACHE_SIZE) -> None:
+        """Initialize the SunElevationCache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[SunElevationCacheKey, datetime | ValueError] = (
+            OrderedDict()
+        )
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_setup(self, hass: HomeAssistant) -> None:
+        """Clear the cache at midnight and whenever the home location changes."""
+
+        @callback
+        def _handle_midnight(_now: datetime) -> None:
+            self.clear()
+
+        @callback
+        def _handle_core_config_update(_event: Event) -> None:
+            self.clear()
+            async_dispatcher_send(hass, f"{DOMAIN}_{SIGNAL_LOCATION_UPDATED}")
+
+        self._unsubs.extend(
+            (
+                async_track_time_change(
+                    hass, _handle_midnight, hour=0, minute=0, second=0
+                ),
+                hass.bus.async_listen(
+                    EVENT_CORE_CONFIG_UPDATE, _handle_core_config_update
+                ),
+            )
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Remove all listeners and clear the cache."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        self.clear()
+
+    def clear(self) -> None:
+        """Clear the cached crossing times, keeping the statistics."""
+        _LOGGER.debug("Clearing sun elevation cache: %s", self.cache_info())
+        self._cache.clear()
+
+    def cache_info(self) -> SunElevationCacheInfo:
+        """Return the cache statistics."""
+        return SunElevationCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._cache)
+        )
+
+    def time_at_elevation(
+        self,
+        observer: Observer,
+        elevation: float,
+        day: date,
+        direction: SunDirection,
+        tz: tzinfo,
+    ) -> datetime:
+        """Return the time the sun crosses the elevation, solving it only once.
+
+        Raises ValueError if the sun never reaches the elevation on that day.
+        """
+        key: SunElevationCacheKey = (
+            observer.latitude,
+            observer.longitude,
+            observer.elevation,
+            day,
+            elevation,
+            direction,
+            tz,
+        )
+        if (result := self._cache.get(key)) is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        else:
+            self.misses += 1
+            try:
+                result = time_at_elevation(
+                    observer, elevation, date=day, direction=direction, tzinfo=tz
+                )
+            except ValueError as e:
+                result = e
+            self._cache[key] = result
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        if isinstance(result, ValueError):
+            raise result
+        return result
@@ -0,0 +1,170 @@
+"""Yearly sun crossing table for the Scene Router integration."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, time, timedelta, tzinfo
+import logging
+from typing import Any
+
+from astral import Observer
+from astral.sun import SunDirection, time_at_elevation
+
+from homeassistant.core import HomeAssistant, callback
+
+from .store import SceneRouterStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Leap year whose days index the table, so that February 29th has a row.
+_TABLE_YEAR = 2024
+_TABLE_DAYS = 366
+# Minute offset of days on which the sun never reaches the elevation.
+_NO_CROSSING = -0x8000
+
+type SunTableLocation = tuple[float, float, float, str]
+type SunTableRowKey = tuple[float, SunDirection]
+
+
+def _get_day_index(day: date) -> int:
+    """Return the row index of the day, ignoring its year."""
+    return date(_TABLE_YEAR, day.month, day.day).timetuple().tm_yday - 1
+
+
+def _get_row_name(row_key: SunTableRowKey) -> str:
+    """Return the name of a row in the stored table."""
+    elevation, direction = row_key
+    return f"{direction.name.lower()}:{elevation}"
+
+
+def _parse_row_name(name: str) -> SunTableRowKey:
+    """Return the row key of a row name in the stored table."""
+    direction, elevation = name.split(":", 1)
+    return float(elevation), SunDirection[direction.upper()]
+
+
+def _build_row(observer: Observer, row_key: SunTableRowKey, tz: tzinfo) -> array[int]:
+    """Solve the crossings of every day of the year as minutes after UTC midnight.
+
+    UTC offsets keep the table independent of daylight saving time, so one
+    table serves every year.
+    """
+    elevation, direction = row_key
+    row = array("h", [_NO_CROSSING]) * _TABLE_DAYS
+    for index in range(_TABLE_DAYS):
+        day = date(_TABLE_YEAR, 1, 1) + timedelta(days=index)
+        try:
+            crossing = time_at_elevation(
+                observer, elevation, date=day, direction=direction, tzinfo=tz
+            )
+        except ValueError:
+            continue
+        midnight = datetime.combine(day, time(), UTC)
+        row[index] = round((crossing - midnight).total_seconds() / 60)
+    return row
+
+
+class SunTable:
+    """Precomputed sun crossing times of a scene router's elevation thresholds.
+
+    Each row holds the crossing of one elevation in one direction for every
+    day of the year as minute offsets. Rows are persisted in the store and
+    only solved again when the home location or the thresholds change.
+    """
+
+    def __init__(self, store: SceneRouterStore, key: str) -> None:
+        """Initialize the SunTable."""
+        self.store = store
+        self.key = key
+        self._location: SunTableLocation | None = None
+        self._rows: dict[SunTableRowKey, array[int]] = {}
+        self._loaded = False
+
+    @callback
+    def _async_load(self) -> None:
+        """Load the table from the store."""
+        self._loaded = True
+        if not (data := self.store.get(self.key)):
+            return
+
+        try:
+            self._location = tuple(data["location"])
+            self._rows = {
+                _parse_row_name(name): array("h", offsets)
+                for name, offsets in data["rows"].items()
+                if len(offsets) == _TABLE_DAYS
+            }
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.warning("Discarding invalid sun table '%s': %s", self.key, e)
+            self._location = None
+            self._rows = {}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the table in its stored form."""
+        return {
+            "location": list(self._location) if self._location else None,
+            "rows": {
+                _get_row_name(row_key): row.tolist()
+                for row_key, row in self._rows.items()
+            },
+        }
+
+    async def async_update(
+        self,
+        hass: HomeAssistant,
+        observer: Observer,
+        tz: tzinfo,
+        row_keys: Iterable[SunTableRowKey],
+    ) -> None:
+        """Make the table hold exactly the given rows for the home location."""
+        if not self._loaded:
+            self._async_load()
+
+        location: SunTableLocation = (
+            observer.latitude,
+            observer.longitude,
+            observer.elevation,
+            str(tz),
+        )
+        row_keys = set(row_keys)
+        if location == self._location and row_keys == self._rows.keys():
+            return
+
+        if location != self._location:
+            self._rows.clear()
+        rows = {
+            row_key: row
+            for row_key in row_keys
+            if (row := self._rows.get(row_key)) is not None
+        }
+        if missing := row_keys - rows.keys():
+            _LOGGER.debug(
+                "Building sun table '%s' rows for %s", self.key, sorted(missing)
+            )
+            for row_key in missing:
+                rows[row_key] = await hass.async_add_executor_job(
+                    _build_row, observer, row_key, tz
+                )
+
+        self._location = location
+        self._rows = rows
+        self.store.async_set(self.key, self.as_dict())
+
+    def time_at_elevation(
+        self, elevation: float, day: date, direction: SunDirection, tz: tzinfo
+    ) -> datetime | None:
+        """Return the crossing time from the table, or None if it has no row.
+
+        Raises ValueError if the sun never reaches the elevation on that day.
+        """
+        if (row := self._rows.get((elevation, direction))) is None:
+            return None
+        if (offset := row[_get_day_index(day)]) == _NO_CROSSING:
+            raise ValueError(
+                f"Sun never reaches {elevation} degrees {direction.name.lower()}"
+                f" on {day}"
+            )
+        return (
+            datetime.combine(day, time(), UTC) + timedelta(minutes=offset)
+        ).astimezone(tz)
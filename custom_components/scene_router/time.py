@@ -1,5 +1,6 @@
 """Time platform for Scene Router integration."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import time
 import logging
@@ -12,27 +13,30 @@ from homeassistant.components.time import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.storage import Store
 
 from .const import (
     DATA_COORDINATORS,
     DATA_SCENE_ROUTERS,
     DATA_STORE,
     DOMAIN,
-    ConditionType,
+    SIGNAL_CONDITIONS_ADDED,
 )
 from .coordinator import SceneRouterCoordinator
 from .entity import (
+    CONDITION_TO_DOMAIN,
     SceneRouterConditionEntity,
     SceneRouterConditionEntityDescription,
     _get_entity_key,
     _get_translation_key,
 )
+from .models import SceneConfig
 from .scene_router import SceneRouter
+from .store import SceneRouterStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,45 +61,58 @@ async def async_setup_entry(
     data: dict[str, Any] = hass.data[DOMAIN]
     scene_router: SceneRouter = data[DATA_SCENE_ROUTERS][config_entry.entry_id]
     coordinator: SceneRouterCoordinator = data[DATA_COORDINATORS][config_entry.entry_id]
-    store: Store = data.get(DATA_STORE)
-    entity_descriptions: list[TimeEntityDescription] = []
-
-    for scene_config in scene_router.scene_router_config.scene_configs:
-        if not (scene := er.async_get(hass).async_get(scene_config.scene)):
-            _LOGGER.warning(
-                "Scene '%s' not found in entity registry, skipping conditions",
-                scene_config.scene,
+    store: SceneRouterStore = data[DATA_STORE]
+
+    @callback
+    def _async_add_condition_entities(scene_configs: Iterable[SceneConfig]) -> None:
+        """Add entities for the scene configs with a matching condition."""
+        entity_descriptions: list[TimeEntityDescription] = []
+
+        for scene_config in scene_configs:
+            if not (scene := er.async_get(hass).async_get(scene_config.scene)):
+                _LOGGER.warning(
+                    "Scene '%s' not found in entity registry, skipping conditions",
+                    scene_config.scene,
+                )
+                continue
+
+            if CONDITION_TO_DOMAIN.get(scene_config.condition) != TIME_DOMAIN:
+                continue
+
+            entity_description = SceneRouterTimeEntityDescription(
+                key=_get_entity_key(
+                    scene_router.scene_router_config.name,
+                    scene_config.scene,
+                    scene_config.condition,
+                ),
+                translation_key=_get_translation_key(scene_config.condition),
+                translation_placeholders={
+                    "scene": scene.name or scene.original_name or scene_config.scene,
+                },
+                entity_category=EntityCategory.CONFIG,
+                condition_type=scene_config.condition,
+                scene_entity_id=scene_config.scene,
             )
-            continue
-
-        if scene_config.condition != ConditionType.TIME_AFTER:
-            continue
-
-        entity_description = SceneRouterTimeEntityDescription(
-            key=_get_entity_key(
-                scene_router.scene_router_config.name,
-                scene_config.scene,
-                scene_config.condition,
-            ),
-            translation_key=_get_translation_key(scene_config.condition),
-            translation_placeholders={
-                "scene": scene.name or scene.original_name or scene_config.scene,
-            },
-            entity_category=EntityCategory.CONFIG,
-            condition_type=scene_config.condition,
-            scene_entity_id=scene_config.scene,
+            entity_descriptions.append(entity_description)
+
+        async_add_entities(
+            SceneRouterTimeEntity(
+                store,
+                config_entry,
+                scene_router,
+                coordinator,
+                entity_description,
+            )
+            for entity_description in entity_descriptions
         )
-        entity_descriptions.append(entity_description)
-
-    async_add_entities(
-        SceneRouterTimeEntity(
-            store,
-            config_entry,
-            scene_router,
-            coordinator,
-            entity_description,
+
+    _async_add_condition_entities(scene_router.scene_router_config.scene_configs)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            f"{DOMAIN}_{config_entry.entry_id}_{SIGNAL_CONDITIONS_ADDED}",
+            _async_add_condition_entities,
         )
-        for entity_description in entity_descriptions
     )
 
 
@@ -106,10 +123,10 @@ class SceneRouterTimeEntity(SceneRouterConditionEntity, TimeEntity, RestoreEntit
         """Handle entity which will be added to hass."""
         await super().async_added_to_hass()
 
-        data: dict[str, Any] = await self.store.async_load()
         self._attr_native_value = time.fromisoformat(
-            data.get(self.entity_description.key, time().isoformat())
+            self.store.get(self.entity_description.key, time().isoformat())
         )
+        self.coordinator.async_invalidate_timeline()
 
     async def async_set_value(self, value: time) -> None:
         """Change the time."""
@@ -119,9 +136,8 @@ class SceneRouterTimeEntity(SceneRouterConditionEntity, TimeEntity, RestoreEntit
             value,
         )
 
-        data: dict[str, Any] = await self.store.async_load()
-        data[self.entity_description.key] = value.isoformat()
-        await self.store.async_save(data)
+        self.store.async_set(self.entity_description.key, value.isoformat())
         self._attr_native_value = value
+        self.coordinator.async_invalidate_timeline()
 
         await self.coordinator.async_request_refresh()
@@ -0,0 +1,106 @@
+"""Daily scene timeline for the Scene Router integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time
+
+from .models import SceneConfig
+
+
+@dataclass(frozen=True)
+class SceneTimelinePoint:
+    """Point in time from which a scene config becomes active.
+
+    A point with a to_time stops being active at that time of the same day.
+    """
+
+    from_time: time
+    scene_config: SceneConfig
+    to_time: time | None = None
+
+
+@dataclass(frozen=True)
+class SceneTimelineChange:
+    """Point in time at which the timeline activates another scene."""
+
+    at: datetime
+    scene_config: SceneConfig | None
+
+
+class SceneTimeline:
+    """Sorted timeline of scene configs for a single day."""
+
+    def __init__(self, day: date, points: list[SceneTimelinePoint]) -> None:
+        """Initialize the SceneTimeline."""
+        self.date = day
+        self.points = sorted(points, key=lambda point: point.from_time)
+        self._from_times = [point.from_time for point in self.points]
+        self._change_times = sorted(
+            {point.from_time for point in self.points}
+            | {point.to_time for point in self.points if point.to_time is not None}
+        )
+
+    def active_point(
+        self,
+        at: time,
+        candidates: Collection[SceneConfig] | None = None,
+    ) -> SceneTimelinePoint | None:
+        """Return the point active at the given time among the candidates.
+
+        The last point starting at or before the given time and not ended yet
+        wins. Before the first point of the day, the last point of the previous
+        day without a to_time stays active.
+        """
+        candidate_ids = (
+            None if candidates is None else {id(candidate) for candidate in candidates}
+        )
+        index = bisect_right(self._from_times, at)
+        for offset in range(1, len(self.points) + 1):
+            point = self.points[index - offset]
+            if point.to_time is not None and (offset > index or at >= point.to_time):
+                continue
+            if candidate_ids is None or id(point.scene_config) in candidate_ids:
+                return point
+        return None
+
+    def next_point(self, now: datetime) -> SceneTimelinePoint | None:
+        """Return the first point starting after the given time on this day."""
+        index = bisect_right(self._from_times, now.time())
+        if index >= len(self.points):
+            return None
+        return self.points[index]
+
+    def change_times(self, after: time | None = None) -> list[time]:
+        """Return the times a point starts or ends after the given time, if any."""
+        if after is None:
+            return self._change_times
+        return self._change_times[bisect_right(self._change_times, after) :]
+
+    def next_change_at(self, now: datetime) -> datetime | None:
+        """Return the datetime a point starts or ends next on this day, if any."""
+        index = bisect_right(self._change_times, now.time())
+        if index >= len(self._change_times):
+            return None
+        return datetime.combine(self.date, self._change_times[index], tzinfo=now.tzinfo)
+
+
+def preview_timeline(
+    datetimes: Iterable[datetime],
+    build_timeline: Callable[[datetime], SceneTimeline],
+    candidates: Collection[SceneConfig] | None = None,
+) -> list[SceneTimelinePoint | None]:
+    """Return the point active at each datetime among the candidates.
+
+    Only one timeline is built per distinct date, so sun crossings are computed
+    once per day no matter how many datetimes fall on it.
+    """
+    timelines: dict[date, SceneTimeline] = {}
+    points: list[SceneTimelinePoint | None] = []
+    for at in datetimes:
+        if (timeline := timelines.get(day := at.date())) is None:
+            timeline = timelines[day] = build_timeline(at)
+        points.append(timeline.active_point(at.time(), candidates))
+    return points
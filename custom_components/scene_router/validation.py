@@ -54,25 +54,39 @@ SCENE_SCHEMA = vol.Schema(
 
 # ─── Router-Entry Schema ───────────────────────────────────────────────────────
 
-ROUTER_SCHEMA = vol.Schema(
-    {
-        vol.Required("name"): cv.string,
-        vol.Optional("enable_device", default=True): cv.boolean,
-        vol.Optional("enable_preview_sensor", default=True): cv.boolean,
-        vol.Optional("enable_auto_change", default=True): cv.boolean,
-        vol.Optional("enable_condition_entities", default=True): cv.boolean,
-        vol.Required("lights"): vol.All(cv.ensure_list, [cv.entity_id]),
-        vol.Optional("lux_sensors", default=[]): vol.All(
-            cv.ensure_list, [cv.entity_id]
-        ),
-        vol.Required("scenes"): vol.All(cv.ensure_list, [SCENE_SCHEMA]),
-    },
-    extra=vol.PREVENT_EXTRA,
+ROUTER_SCHEMA = vol.All(
+    cv.deprecated("enable_device"),
+    cv.deprecated("enable_preview_sensor"),
+    cv.deprecated("enable_condition_entities"),
+    vol.Schema(
+        {
+            vol.Required("name"): cv.string,
+            vol.Optional("enable_device"): cv.boolean,
+            vol.Optional("enable_preview_sensor"): cv.boolean,
+            vol.Optional("enable_auto_change", default=True): cv.boolean,
+            vol.Optional("enable_condition_entities"): cv.boolean,
+            vol.Required("lights"): vol.All(cv.ensure_list, [cv.entity_id]),
+            vol.Optional("lux_sensors", default=[]): vol.All(
+                cv.ensure_list, [cv.entity_id]
+            ),
+            vol.Required("scenes"): vol.All(cv.ensure_list, [SCENE_SCHEMA]),
+        },
+        extra=vol.PREVENT_EXTRA,
+    ),
 )
 
+
+def _has_unique_names(routers: list[dict]) -> list[dict]:
+    """Validate that no two routers share a name."""
+    names = [router["name"] for router in routers]
+    if duplicates := sorted({name for name in names if names.count(name) > 1}):
+        raise vol.Invalid(f"Duplicate router names: {', '.join(duplicates)}")
+    return routers
+
+
 # ─── Gesamtes CONFIG_SCHEMA ───────────────────────────────────────────────────
 
 CONFIG_SCHEMA = vol.Schema(
-    {DOMAIN: vol.All(cv.ensure_list, [ROUTER_SCHEMA])},
+    {DOMAIN: vol.All(cv.ensure_list, [ROUTER_SCHEMA], _has_unique_names)},
     extra=vol.ALLOW_EXTRA,
 )
@@ -0,0 +1,181 @@
+"""Import of YAML configured routers for the Scene Router integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import time
+import logging
+from typing import Any
+
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant
+
+from .config_flow import _get_errors
+from .const import (
+    CONF_CONDITION,
+    CONF_ENABLE_AUTO_CHANGE,
+    CONF_FORCING_CUSTOM_CONDITIONS,
+    CONF_LIGHT_ENTITIES,
+    CONF_LUX_SENSORS,
+    CONF_NAME,
+    CONF_REQUIRED_CUSTOM_CONDITIONS,
+    CONF_SCENE,
+    CONF_SCENE_CONFIGS,
+    DATA_CONDITION_VALUES,
+    DOMAIN,
+    ConditionType,
+)
+from .entity import _get_entity_key
+from .store import SceneRouterStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# YAML condition list, key and the condition type it maps to, in order of
+# precedence when a scene lists more than one.
+YAML_CONDITIONS: tuple[tuple[str, str, ConditionType], ...] = (
+    ("time_conditions", "after", ConditionType.TIME_AFTER),
+    ("time_conditions", "before", ConditionType.TIME_BEFORE),
+    ("elevation_conditions", "below", ConditionType.SUN_BELOW),
+    ("elevation_conditions", "above", ConditionType.SUN_ABOVE),
+    ("lux_conditions", "below", ConditionType.LUX_BELOW),
+)
+
+
+def _get_scene_condition(
+    router_name: str, scene: dict[str, Any]
+) -> tuple[ConditionType, float | time] | None:
+    """Return the condition type and threshold of a YAML scene, if any."""
+    conditions = [
+        (condition_type, condition[key])
+        for conf, key, condition_type in YAML_CONDITIONS
+        for condition in scene[conf]
+        if key in condition
+    ]
+    if any("above" in condition for condition in scene["lux_conditions"]):
+        _LOGGER.warning(
+            "Lux above conditions of scene %s in router '%s' are not supported",
+            scene[CONF_SCENE],
+            router_name,
+        )
+    if not conditions:
+        return None
+    if len(conditions) > 1:
+        _LOGGER.warning(
+            "Scene %s in router '%s' has multiple conditions, only %s will be used",
+            scene[CONF_SCENE],
+            router_name,
+            conditions[0][0],
+        )
+    return conditions[0]
+
+
+def router_to_options(
+    router: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Convert a router validated by ROUTER_SCHEMA to config entry options.
+
+    Returns the options and the condition entity values to seed the store with.
+    """
+    name: str = router[CONF_NAME]
+    scene_configs: list[dict[str, Any]] = []
+    condition_values: dict[str, Any] = {}
+    for scene in router["scenes"]:
+        scene_config: dict[str, Any] = {CONF_SCENE: scene[CONF_SCENE]}
+        if condition := _get_scene_condition(name, scene):
+            condition_type, value = condition
+            scene_config[CONF_CONDITION] = condition_type.value
+            scene_config[CONF_REQUIRED_CUSTOM_CONDITIONS] = scene["conditions"]
+            condition_values[
+                _get_entity_key(name, scene[CONF_SCENE], condition_type)
+            ] = value.isoformat() if isinstance(value, time) else value
+        else:
+            scene_config[CONF_FORCING_CUSTOM_CONDITIONS] = scene["conditions"]
+        scene_configs.append(scene_config)
+
+    options = {
+        CONF_NAME: name,
+        CONF_ENABLE_AUTO_CHANGE: router[CONF_ENABLE_AUTO_CHANGE],
+        CONF_LIGHT_ENTITIES: router["lights"],
+        CONF_LUX_SENSORS: router[CONF_LUX_SENSORS],
+        CONF_SCENE_CONFIGS: scene_configs,
+    }
+    return options, condition_values
+
+
+async def async_import_routers(
+    hass: HomeAssistant, store: SceneRouterStore, routers: list[dict[str, Any]]
+) -> None:
+    """Import the YAML routers as config entries in one batch.
+
+    Routers whose options did not change are left alone, changed routers are
+    updated in place and imported routers no longer configured are removed.
+    New routers are created by import flows running in the background.
+
+    Condition values are only written to the store if they are missing there or
+    changed in the YAML configuration, so values changed in the UI are kept.
+    """
+    entries = {
+        entry.unique_id: entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.source == SOURCE_IMPORT
+    }
+
+    new_imports: list[dict[str, Any]] = []
+    for router in routers:
+        options, condition_values = router_to_options(router)
+        if errors := _get_errors(options):
+            _LOGGER.error(
+                "Invalid Scene Router '%s' in YAML configuration: %s",
+                router[CONF_NAME],
+                errors,
+            )
+            continue
+
+        entry = entries.pop(router[CONF_NAME], None)
+        previous_values: dict[str, Any] = (
+            entry.data.get(DATA_CONDITION_VALUES, {}) if entry else {}
+        )
+        for key, value in condition_values.items():
+            if store.get(key) is None or previous_values.get(key) != value:
+                store.async_set(key, value)
+
+        if not entry:
+            new_imports.append({**options, DATA_CONDITION_VALUES: condition_values})
+        elif {
+            **entry.options,
+            **options,
+        } != entry.options or previous_values != condition_values:
+            hass.config_entries.async_update_entry(
+                entry,
+                title=router[CONF_NAME],
+                data={**entry.data, DATA_CONDITION_VALUES: condition_values},
+                options={**entry.options, **options},
+            )
+
+    for entry in entries.values():
+        _LOGGER.info(
+            "Removing Scene Router '%s' no longer in YAML configuration", entry.title
+        )
+        await hass.config_entries.async_remove(entry.entry_id)
+
+    if not new_imports:
+        return
+
+    _LOGGER.debug("Importing %d Scene Routers from YAML", len(new_imports))
+    hass.async_create_task(
+        _async_create_entries(hass, new_imports), f"{DOMAIN} YAML import"
+    )
+
+
+async def _async_create_entries(
+    hass: HomeAssistant, new_imports: list[dict[str, Any]]
+) -> None:
+    """Run the import flows of all new routers concurrently."""
+    await asyncio.gather(
+        *(
+            hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data=import_data
+            )
+            for import_data in new_imports
+        )
+    )
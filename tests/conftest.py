@@ -0,0 +1,96 @@
+"""Fixtures for the Scene Router tests."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from astral import LocationInfo
+import pytest
+
+from custom_components.scene_router.const import (
+    DATA_SUN_ELEVATION_CACHE,
+    DOMAIN,
+)
+from custom_components.scene_router.entity import _get_entity_key
+from custom_components.scene_router.scene_router import SceneRouter
+from custom_components.scene_router.sun import SunElevationCache
+
+LOCATION = LocationInfo("Home", "Home", "UTC", 52.52, 13.40)
+
+
+def _compile_state_condition(
+    _hass: Any, config: dict[str, Any]
+) -> Callable[[Any, Any], bool]:
+    """Return a checker for a state condition reading the stubbed states."""
+
+    def _test(hass: Any, _variables: Any = None) -> bool:
+        state = hass.states.get(config["entity_id"])
+        return state is not None and state.state == config["state"]
+
+    return _test
+
+
+@pytest.fixture
+def states() -> dict[str, SimpleNamespace]:
+    """Return the stubbed entity states by entity ID."""
+    return {}
+
+
+@pytest.fixture
+def hass(states: dict[str, SimpleNamespace]) -> Iterator[MagicMock]:
+    """Return a stubbed HomeAssistant instance."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {DATA_SUN_ELEVATION_CACHE: SunElevationCache()}}
+    hass.states.get.side_effect = states.get
+
+    with (
+        patch("custom_components.scene_router.scene_router.dr.async_get"),
+        patch(
+            "custom_components.scene_router.scene_router.get_astral_location",
+            return_value=(LOCATION, 0.0),
+        ),
+        patch(
+            "custom_components.scene_router.scene_router.condition_helper.async_validate_condition_config",
+            AsyncMock(side_effect=lambda _hass, config: config),
+        ),
+        patch(
+            "custom_components.scene_router.scene_router.condition_helper.async_from_config",
+            AsyncMock(side_effect=_compile_state_condition),
+        ),
+    ):
+        yield hass
+
+
+@pytest.fixture
+def make_router(
+    hass: MagicMock,
+) -> Callable[[dict[str, Any], dict[str, Any]], Awaitable[SceneRouter]]:
+    """Return a factory for compiled routers with stubbed condition entities."""
+
+    async def _make_router(
+        options: dict[str, Any], condition_values: dict[str, Any]
+    ) -> SceneRouter:
+        config_entry = MagicMock(entry_id=options["name"], options=options)
+        scene_router = SceneRouter(hass, config_entry)
+        scene_router_config = scene_router.scene_router_config
+
+        for scene_config in scene_router_config.scene_configs:
+            if scene_config.condition is None:
+                continue
+            key = _get_entity_key(
+                scene_router_config.name, scene_config.scene, scene_config.condition
+            )
+            scene_router.condition_entities[scene_config.scene] = {
+                scene_config.condition: SimpleNamespace(
+                    entity_id=f"{scene_config.condition}.{key}",
+                    state=str(condition_values[key]),
+                )
+            }
+
+        await scene_router.async_compile_conditions()
+        return scene_router
+
+    return _make_router
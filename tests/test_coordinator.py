@@ -0,0 +1,139 @@
+"""Tests for the Scene Router coordinator."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.scene_router.const import (
+    CONF_CONDITION,
+    CONF_ENABLE_EVENT_DRIVEN_UPDATES,
+    CONF_FORCING_CUSTOM_CONDITIONS,
+    CONF_LIGHT_ENTITIES,
+    CONF_MAX_RESULT_AGE,
+    CONF_NAME,
+    CONF_SCENE,
+    CONF_SCENE_CONFIGS,
+)
+from custom_components.scene_router.coordinator import SceneRouterCoordinator
+from custom_components.scene_router.scene_router import SceneRouter
+
+OPTIONS = {
+    CONF_NAME: "Living Room",
+    CONF_LIGHT_ENTITIES: ["light.living_room"],
+    CONF_SCENE_CONFIGS: [
+        {CONF_SCENE: "scene.day", CONF_CONDITION: "time_after"},
+        {
+            CONF_SCENE: "scene.movie",
+            CONF_FORCING_CUSTOM_CONDITIONS: [
+                {
+                    "condition": "state",
+                    "entity_id": "input_boolean.movie",
+                    "state": "on",
+                }
+            ],
+        },
+    ],
+    CONF_ENABLE_EVENT_DRIVEN_UPDATES: False,
+    CONF_MAX_RESULT_AGE: 60,
+}
+
+CONDITION_VALUES = {"Living Room_day_time_after": "06:00:00"}
+
+
+type MakeRouter = Callable[[dict[str, Any], dict[str, Any]], Awaitable[SceneRouter]]
+
+
+async def _make_coordinator(
+    hass: MagicMock, make_router: MakeRouter
+) -> SceneRouterCoordinator:
+    """Return a coordinator of a router with a forced movie scene."""
+    scene_router = await make_router(OPTIONS, CONDITION_VALUES)
+    return SceneRouterCoordinator(hass, scene_router.config_entry, scene_router)
+
+
+def _dependency_change(entity_id: str) -> SimpleNamespace:
+    """Return a state changed event of the entity."""
+    return SimpleNamespace(data={"entity_id": entity_id})
+
+
+@pytest.mark.asyncio
+async def test_result_is_reused_until_dirty(
+    hass: MagicMock, make_router: MakeRouter, states: dict[str, SimpleNamespace]
+) -> None:
+    """Test the selected scene is only evaluated again after a change."""
+    states["input_boolean.movie"] = SimpleNamespace(state="off")
+    coordinator = await _make_coordinator(hass, make_router)
+    scene_router = coordinator.scene_router
+    with patch.object(
+        scene_router, "async_select_scene", wraps=scene_router.async_select_scene
+    ) as select_scene:
+        assert await coordinator.async_get_selected_scene() == (
+            "scene.day",
+            "scene.day",
+        )
+        assert await coordinator.async_get_selected_scene() == (
+            "scene.day",
+            "scene.day",
+        )
+        assert select_scene.call_count == 1
+
+        states["input_boolean.movie"] = SimpleNamespace(state="on")
+        coordinator.async_handle_dependency_change(
+            _dependency_change("input_boolean.movie")
+        )
+
+        assert await coordinator.async_get_selected_scene() == (
+            "scene.movie",
+            "scene.movie",
+        )
+        assert select_scene.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_timeline_invalidation_discards_result(
+    hass: MagicMock, make_router: MakeRouter
+) -> None:
+    """Test rebuilding the timeline discards the result."""
+    coordinator = await _make_coordinator(hass, make_router)
+    await coordinator.async_get_selected_scene()
+    assert coordinator.result_is_current
+
+    coordinator.async_invalidate_timeline()
+
+    assert not coordinator.result_is_current
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("time_dependent", "expected"), [(False, True), (True, False)])
+async def test_result_expires_with_time_dependent_conditions(
+    hass: MagicMock, make_router: MakeRouter, time_dependent: bool, expected: bool
+) -> None:
+    """Test only results depending on the time expire after the maximum age."""
+    coordinator = await _make_coordinator(hass, make_router)
+    coordinator.scene_router.has_time_dependent_conditions = time_dependent
+    with patch(
+        "custom_components.scene_router.coordinator.monotonic", return_value=1000.0
+    ):
+        await coordinator.async_get_selected_scene()
+    with patch(
+        "custom_components.scene_router.coordinator.monotonic", return_value=1061.0
+    ):
+        assert coordinator.result_is_current is expected
+
+
+@pytest.mark.asyncio
+async def test_failed_update_discards_result(
+    hass: MagicMock, make_router: MakeRouter
+) -> None:
+    """Test a failed update is not reused."""
+    coordinator = await _make_coordinator(hass, make_router)
+    await coordinator.async_get_selected_scene()
+
+    coordinator.last_update_success = False
+
+    assert not coordinator.result_is_current
@@ -0,0 +1,75 @@
+"""Tests for the illuminance smoothing."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.scene_router.lux import LuxFilter, is_below
+
+
+@pytest.mark.parametrize(
+    ("value", "was_below", "expected"),
+    [
+        (99.0, False, True),
+        (100.0, False, False),
+        (105.0, False, False),
+        (105.0, True, True),
+        (109.9, True, True),
+        (110.0, True, False),
+    ],
+)
+def test_is_below(value: float, was_below: bool, expected: bool) -> None:
+    """Test a value has to rise past the hysteresis band to count as above."""
+    assert is_below(value, 100.0, 10.0, was_below) is expected
+
+
+def test_is_below_hysteresis_sequence() -> None:
+    """Test readings around the threshold do not flap."""
+    below = False
+    states = []
+    for value in (120.0, 95.0, 104.0, 96.0, 108.0, 112.0, 104.0):
+        below = is_below(value, 100.0, 10.0, below)
+        states.append(below)
+
+    assert states == [False, True, True, True, True, False, False]
+
+
+def test_lux_filter_first_reading() -> None:
+    """Test the first reading is taken as is."""
+    lux_filter = LuxFilter()
+
+    assert lux_filter.value is None
+    assert lux_filter.add(80.0) == 80.0
+    assert lux_filter.value == 80.0
+
+
+def test_lux_filter_smoothing() -> None:
+    """Test the median of the window is exponentially smoothed."""
+    lux_filter = LuxFilter(window_size=3, alpha=0.5)
+
+    lux_filter.add(100.0)
+    assert lux_filter.add(200.0) == 125.0
+    assert lux_filter.add(300.0) == 162.5
+    assert lux_filter.add(400.0) == 231.25
+
+
+def test_lux_filter_rejects_outliers() -> None:
+    """Test a single outlier does not move the smoothed value."""
+    lux_filter = LuxFilter(window_size=3, alpha=0.5)
+
+    for reading in (100.0, 100.0, 5000.0, 100.0):
+        lux_filter.add(reading)
+
+    assert lux_filter.value == 100.0
+
+
+def test_lux_filter_clear() -> None:
+    """Test clearing discards the readings and the smoothed value."""
+    lux_filter = LuxFilter(window_size=3, alpha=0.5)
+    lux_filter.add(100.0)
+    lux_filter.add(100.0)
+
+    lux_filter.clear()
+
+    assert lux_filter.value is None
+    assert lux_filter.add(20.0) == 20.0
@@ -0,0 +1,219 @@
+"""Tests for the per-light scene diffing."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.core import State
+
+from custom_components.scene_router.scene_diff import SceneApplication
+
+ROUTER_LIGHTS = ("light.a", "light.b", "light.c", "light.d")
+
+WARM = {"brightness": 128, "color_temp_kelvin": 3000, "color_mode": "color_temp"}
+
+
+def _states(states: dict[str, tuple[str, dict[str, Any]]]) -> dict[str, State]:
+    """Return State objects by entity ID."""
+    return {
+        entity_id: State(entity_id, state, attributes)
+        for entity_id, (state, attributes) in states.items()
+    }
+
+
+@pytest.fixture
+def scenes() -> dict[str, dict[str, State]]:
+    """Return the stored states of the scenes by scene entity ID."""
+    return {}
+
+
+@pytest.fixture
+def hass(scenes: dict[str, dict[str, State]]) -> Iterator[MagicMock]:
+    """Return a stubbed HomeAssistant instance with the current light states."""
+    hass = MagicMock()
+    current = _states(
+        {
+            "light.a": ("off", {}),
+            "light.b": ("on", {"brightness": 50, "color_temp_kelvin": 3000}),
+            "light.c": ("on", {"brightness": 128, "color_temp_kelvin": 3000}),
+            "light.d": ("on", {"brightness": 255}),
+        }
+    )
+    hass.states.get.side_effect = current.get
+
+    with patch(
+        "custom_components.scene_router.scene_diff.get_scene_states",
+        side_effect=lambda _hass, scene_entity_id: scenes.get(scene_entity_id),
+    ):
+        yield hass
+
+
+def test_lights_are_grouped(
+    hass: MagicMock, scenes: dict[str, dict[str, State]]
+) -> None:
+    """Test lights needing the same attributes share one call."""
+    scenes["scene.evening"] = _states(
+        {
+            "light.a": ("on", WARM),
+            "light.b": ("on", WARM),
+            "light.c": ("on", WARM),
+            "light.d": ("off", {}),
+            "switch.fan": ("on", {}),
+            "light.e": ("on", {"brightness": 10}),
+        }
+    )
+    application = SceneApplication()
+
+    application.add_scene(hass, "scene.evening", ROUTER_LIGHTS, True, 2.0)
+
+    assert application.service_calls() == [
+        (
+            "light",
+            "turn_on",
+            {
+                "entity_id": ["light.a", "light.b"],
+                "brightness": 128,
+                "color_temp_kelvin": 3000,
+                "transition": 2.0,
+            },
+        ),
+        ("light", "turn_off", {"entity_id": ["light.d"], "transition": 2.0}),
+        (
+            "scene",
+            "apply",
+            {
+                "entities": {
+                    "switch.fan": {"state": "on"},
+                    "light.e": {"state": "on", "brightness": 10},
+                },
+                "transition": 2.0,
+            },
+        ),
+    ]
+
+
+def test_routers_share_calls(
+    hass: MagicMock, scenes: dict[str, dict[str, State]]
+) -> None:
+    """Test lights of different routers needing the same attributes share a call."""
+    scenes["scene.kitchen"] = _states({"light.a": ("on", WARM)})
+    scenes["scene.hallway"] = _states({"light.b": ("on", WARM)})
+    application = SceneApplication()
+
+    application.add_scene(hass, "scene.kitchen", ("light.a",), True, None)
+    application.add_scene(hass, "scene.hallway", ("light.b",), True, None)
+
+    assert application.service_calls() == [
+        (
+            "light",
+            "turn_on",
+            {
+                "entity_id": ["light.a", "light.b"],
+                "brightness": 128,
+                "color_temp_kelvin": 3000,
+            },
+        ),
+    ]
+
+
+def test_scenes_without_diffing(
+    hass: MagicMock, scenes: dict[str, dict[str, State]]
+) -> None:
+    """Test scenes are turned on as a whole, grouped by transition."""
+    scenes["scene.evening"] = _states({"light.a": ("on", WARM)})
+    application = SceneApplication()
+
+    application.add_scene(hass, "scene.evening", ROUTER_LIGHTS, False, None)
+    application.add_scene(hass, "scene.evening", ROUTER_LIGHTS, False, None)
+    application.add_scene(hass, "scene.unknown", ROUTER_LIGHTS, True, None)
+    application.add_scene(hass, "scene.night", ROUTER_LIGHTS, False, 1.0)
+
+    assert application.service_calls() == [
+        ("scene", "turn_on", {"entity_id": ["scene.evening", "scene.unknown"]}),
+        ("scene", "turn_on", {"entity_id": ["scene.night"], "transition": 1.0}),
+    ]
+
+
+def test_unchanged_lights_are_skipped(
+    hass: MagicMock, scenes: dict[str, dict[str, State]]
+) -> None:
+    """Test a scene matching the current light states makes no calls."""
+    scenes["scene.evening"] = _states({"light.c": ("on", WARM)})
+    application = SceneApplication()
+
+    application.add_scene(hass, "scene.evening", ROUTER_LIGHTS, True, None)
+
+    assert application.service_calls() == []
+
+
+@pytest.mark.parametrize(
+    ("attributes", "expected"),
+    [
+        (
+            {"brightness_pct": 50, "color_temp": 250},
+            {"brightness": 128, "color_temp_kelvin": 4000},
+        ),
+        (
+            {"hs_color": [30, 50], "color_temp_kelvin": 3000, "color_mode": "hs"},
+            {"hs_color": (30, 50)},
+        ),
+        (
+            {"kelvin": 2700, "effect": "candle"},
+            {"color_temp_kelvin": 2700, "effect": "candle"},
+        ),
+    ],
+)
+def test_light_attributes(
+    hass: MagicMock,
+    scenes: dict[str, dict[str, State]],
+    attributes: dict[str, Any],
+    expected: dict[str, Any],
+) -> None:
+    """Test the attributes commanded for the stored state of a light."""
+    scenes["scene.evening"] = _states({"light.a": ("on", attributes)})
+    application = SceneApplication()
+
+    application.add_scene(hass, "scene.evening", ROUTER_LIGHTS, True, None)
+
+    assert application.service_calls() == [
+        ("light", "turn_on", {"entity_id": ["light.a"], **expected})
+    ]
+
+
+def test_ambiguous_color_is_applied_by_scene(
+    hass: MagicMock, scenes: dict[str, dict[str, State]]
+) -> None:
+    """Test a light whose color cannot be told apart is left to the scene."""
+    attributes = {"hs_color": [30, 50], "color_temp_kelvin": 3000}
+    scenes["scene.evening"] = _states({"light.a": ("on", attributes)})
+    application = SceneApplication()
+
+    application.add_scene(hass, "scene.evening", ROUTER_LIGHTS, True, None)
+
+    assert application.service_calls() == [
+        ("scene", "apply", {"entities": {"light.a": {"state": "on", **attributes}}})
+    ]
+
+
+def test_unverifiable_attributes_are_applied(
+    hass: MagicMock, scenes: dict[str, dict[str, State]]
+) -> None:
+    """Test attributes a light does not report are always applied."""
+    scenes["scene.evening"] = _states(
+        {"light.c": ("on", {"brightness": 128, "white": 200})}
+    )
+    application = SceneApplication()
+
+    application.add_scene(hass, "scene.evening", ROUTER_LIGHTS, True, None)
+
+    assert application.service_calls() == [
+        (
+            "light",
+            "turn_on",
+            {"entity_id": ["light.c"], "brightness": 128, "white": 200},
+        )
+    ]
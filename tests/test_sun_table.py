@@ -0,0 +1,126 @@
+"""Tests for the yearly sun crossing table."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from astral import LocationInfo
+from astral.sun import SunDirection, time_at_elevation
+import pytest
+
+from custom_components.scene_router.sun_table import SunTable
+
+LOCATION = LocationInfo("Home", "Home", "UTC", 52.52, 13.40)
+OTHER_LOCATION = LocationInfo("Other", "Other", "UTC", 40.42, -3.70)
+
+DUSK = (-6.0, SunDirection.SETTING)
+MORNING = (10.0, SunDirection.RISING)
+
+
+class _Store:
+    """In-memory stand-in for the integration store."""
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self.data: dict[str, Any] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the stored value for the key."""
+        return self.data.get(key, default)
+
+    def async_set(self, key: str, value: Any) -> None:
+        """Set the value for the key."""
+        self.data[key] = value
+
+
+@pytest.fixture
+def hass() -> MagicMock:
+    """Return a stubbed HomeAssistant instance running executor jobs inline."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(
+        side_effect=lambda target, *args: target(*args)
+    )
+    return hass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "day", [date(2025, 3, 20), date(2025, 6, 21), date(2025, 12, 21)]
+)
+@pytest.mark.parametrize("row_key", [DUSK, MORNING])
+async def test_time_at_elevation(
+    hass: MagicMock, day: date, row_key: tuple[float, SunDirection]
+) -> None:
+    """Test the table agrees with astral to within two minutes."""
+    table = SunTable(_Store(), "table")
+    await table.async_update(hass, LOCATION.observer, UTC, [row_key])
+    elevation, direction = row_key
+
+    crossing = table.time_at_elevation(elevation, day, direction, UTC)
+
+    assert crossing is not None
+    assert abs(
+        crossing
+        - time_at_elevation(
+            LOCATION.observer, elevation, date=day, direction=direction, tzinfo=UTC
+        )
+    ) <= timedelta(minutes=2)
+
+
+@pytest.mark.asyncio
+async def test_time_at_elevation_without_row(hass: MagicMock) -> None:
+    """Test elevations without a row are left to the caller."""
+    table = SunTable(_Store(), "table")
+    await table.async_update(hass, LOCATION.observer, UTC, [DUSK])
+
+    assert (
+        table.time_at_elevation(-6.0, date(2025, 6, 21), SunDirection.RISING, UTC)
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_time_at_elevation_never_reached(hass: MagicMock) -> None:
+    """Test days on which the sun never reaches the elevation raise."""
+    table = SunTable(_Store(), "table")
+    await table.async_update(
+        hass, LOCATION.observer, UTC, [(70.0, SunDirection.RISING)]
+    )
+
+    with pytest.raises(ValueError):
+        table.time_at_elevation(70.0, date(2025, 6, 21), SunDirection.RISING, UTC)
+
+
+@pytest.mark.asyncio
+async def test_rows_are_stored(hass: MagicMock) -> None:
+    """Test stored rows are loaded instead of being solved again."""
+    store = _Store()
+    await SunTable(store, "table").async_update(
+        hass, LOCATION.observer, UTC, [DUSK, MORNING]
+    )
+    assert hass.async_add_executor_job.await_count == 2
+
+    table = SunTable(store, "table")
+    await table.async_update(hass, LOCATION.observer, UTC, [DUSK])
+
+    assert hass.async_add_executor_job.await_count == 2
+    assert list(store.data["table"]["rows"]) == ["setting:-6.0"]
+    assert table.time_at_elevation(-6.0, date(2025, 6, 21), SunDirection.SETTING, UTC)
+
+
+@pytest.mark.asyncio
+async def test_location_change_rebuilds_rows(hass: MagicMock) -> None:
+    """Test moving the home location solves every row again."""
+    table = SunTable(_Store(), "table")
+    await table.async_update(hass, LOCATION.observer, UTC, [DUSK])
+    before = table.time_at_elevation(-6.0, date(2025, 6, 21), SunDirection.SETTING, UTC)
+
+    await table.async_update(hass, OTHER_LOCATION.observer, UTC, [DUSK])
+
+    assert hass.async_add_executor_job.await_count == 2
+    assert (
+        table.time_at_elevation(-6.0, date(2025, 6, 21), SunDirection.SETTING, UTC)
+        != before
+    )
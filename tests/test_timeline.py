@@ -0,0 +1,122 @@
+"""Tests for the daily scene timeline."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time
+
+import pytest
+
+from custom_components.scene_router.const import ConditionType
+from custom_components.scene_router.models import SceneConfig
+from custom_components.scene_router.timeline import (
+    SceneTimeline,
+    SceneTimelinePoint,
+    preview_timeline,
+)
+
+DAY = date(2025, 6, 21)
+
+NIGHT = SceneConfig("scene.night", ConditionType.TIME_BEFORE)
+MORNING = SceneConfig("scene.morning", ConditionType.TIME_AFTER)
+EVENING = SceneConfig("scene.evening", ConditionType.TIME_AFTER)
+
+
+def _build_timeline(day: date = DAY) -> SceneTimeline:
+    """Return a timeline with a night ending at 6:00 and two open points."""
+    return SceneTimeline(
+        day,
+        [
+            SceneTimelinePoint(time(20), EVENING),
+            SceneTimelinePoint(time(7), MORNING),
+            SceneTimelinePoint(time.min, NIGHT, time(6)),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ("at", "expected"),
+    [
+        (time(0), NIGHT),
+        (time(5, 59), NIGHT),
+        (time(6), EVENING),
+        (time(6, 59), EVENING),
+        (time(7), MORNING),
+        (time(19, 59), MORNING),
+        (time(20), EVENING),
+        (time(23, 59), EVENING),
+    ],
+)
+def test_active_point(at: time, expected: SceneConfig) -> None:
+    """Test the evening point stays active past midnight until the next point."""
+    point = _build_timeline().active_point(at)
+
+    assert point is not None
+    assert point.scene_config is expected
+
+
+def test_active_point_candidates() -> None:
+    """Test the wrap-around skips points that are not candidates."""
+    timeline = _build_timeline()
+
+    point = timeline.active_point(time(6, 30), [MORNING])
+
+    assert point is not None
+    assert point.scene_config is MORNING
+    assert timeline.active_point(time(6, 30), [NIGHT]) is None
+    assert timeline.active_point(time(6, 30), []) is None
+
+
+def test_active_point_empty() -> None:
+    """Test an empty timeline has no active point."""
+    assert SceneTimeline(DAY, []).active_point(time(12)) is None
+
+
+@pytest.mark.parametrize(
+    ("at", "expected"),
+    [
+        (time(0), time(6)),
+        (time(6), time(7)),
+        (time(12), time(20)),
+    ],
+)
+def test_next_change_at(at: time, expected: time) -> None:
+    """Test the next change is the next start or end of a point."""
+    now = datetime.combine(DAY, at, tzinfo=UTC)
+
+    assert _build_timeline().next_change_at(now) == datetime.combine(
+        DAY, expected, tzinfo=UTC
+    )
+
+
+def test_next_change_at_end_of_day() -> None:
+    """Test there is no next change after the last point of the day."""
+    now = datetime.combine(DAY, time(21), tzinfo=UTC)
+
+    assert _build_timeline().next_change_at(now) is None
+
+
+def test_preview_timeline_across_midnight() -> None:
+    """Test previews build one timeline per day and wrap around midnight."""
+    built: list[date] = []
+
+    def _build(at: datetime) -> SceneTimeline:
+        built.append(at.date())
+        return _build_timeline(at.date())
+
+    points = preview_timeline(
+        [
+            datetime(2025, 6, 21, 23, 59, tzinfo=UTC),
+            datetime(2025, 6, 22, 0, 1, tzinfo=UTC),
+            datetime(2025, 6, 22, 6, 30, tzinfo=UTC),
+            datetime(2025, 6, 22, 7, 30, tzinfo=UTC),
+        ],
+        _build,
+    )
+
+    assert [point.scene_config if point else None for point in points] == [
+        EVENING,
+        NIGHT,
+        EVENING,
+        MORNING,
+    ]
+    assert built == [date(2025, 6, 21), date(2025, 6, 22)]
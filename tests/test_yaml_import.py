@@ -0,0 +1,211 @@
+"""Tests for the import of YAML configured routers."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.config_entries import SOURCE_IMPORT
+
+from custom_components.scene_router.const import (
+    CONF_CONDITION,
+    CONF_FORCING_CUSTOM_CONDITIONS,
+    CONF_REQUIRED_CUSTOM_CONDITIONS,
+    CONF_SCENE_CONFIGS,
+    DATA_CONDITION_VALUES,
+)
+from custom_components.scene_router.scene_router import SceneRouter
+from custom_components.scene_router.validation import ROUTER_SCHEMA
+from custom_components.scene_router.yaml_import import (
+    async_import_routers,
+    router_to_options,
+)
+
+MOVIE_CONDITION = {
+    "condition": "state",
+    "entity_id": "input_boolean.movie",
+    "state": "on",
+}
+
+ROUTER = {
+    "name": "Living Room",
+    "lights": ["light.living_room"],
+    "scenes": [
+        {"scene": "scene.day", "time_conditions": [{"after": "06:00"}]},
+        {"scene": "scene.night", "elevation_conditions": [{"below": -6}]},
+        {"scene": "scene.movie", "conditions": [MOVIE_CONDITION]},
+    ],
+}
+
+
+def test_router_to_options() -> None:
+    """Test scenes with a condition get condition values and required conditions."""
+    options, condition_values = router_to_options(ROUTER_SCHEMA(ROUTER))
+
+    assert options[CONF_SCENE_CONFIGS] == [
+        {
+            "scene": "scene.day",
+            CONF_CONDITION: "time_after",
+            CONF_REQUIRED_CUSTOM_CONDITIONS: [],
+        },
+        {
+            "scene": "scene.night",
+            CONF_CONDITION: "sun_below",
+            CONF_REQUIRED_CUSTOM_CONDITIONS: [],
+        },
+        {"scene": "scene.movie", CONF_FORCING_CUSTOM_CONDITIONS: [MOVIE_CONDITION]},
+    ]
+    assert condition_values == {
+        "Living Room_day_time_after": "06:00:00",
+        "Living Room_night_sun_below": -6.0,
+    }
+
+
+def test_router_to_options_multiple_conditions() -> None:
+    """Test only the condition with the highest precedence is imported."""
+    options, condition_values = router_to_options(
+        ROUTER_SCHEMA(
+            {
+                "name": "Hallway",
+                "lights": ["light.hallway"],
+                "scenes": [
+                    {
+                        "scene": "scene.evening",
+                        "time_conditions": [{"before": "22:00"}],
+                        "lux_conditions": [{"below": 50}],
+                    }
+                ],
+            }
+        )
+    )
+
+    assert options[CONF_SCENE_CONFIGS][0][CONF_CONDITION] == "time_before"
+    assert condition_values == {"Hallway_evening_time_before": "22:00:00"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("movie", "expected"), [("on", "scene.movie"), ("off", "scene.day")]
+)
+async def test_forced_scene_without_condition(
+    make_router: Callable[[dict[str, Any], dict[str, Any]], Awaitable[SceneRouter]],
+    states: dict[str, SimpleNamespace],
+    movie: str,
+    expected: str,
+) -> None:
+    """Test an imported scene without a condition is selected while forced."""
+    scene_router = await make_router(*router_to_options(ROUTER_SCHEMA(ROUTER)))
+    states["input_boolean.movie"] = SimpleNamespace(state=movie)
+    now_dt = datetime.fromisoformat("2025-06-21T12:00:00+00:00")
+
+    selected_scene = await scene_router.async_select_scene(now_dt)
+
+    assert selected_scene == (expected, expected)
+    assert [
+        point.scene_config.scene for point in scene_router.get_timeline(now_dt).points
+    ] == ["scene.day", "scene.night"]
+
+
+def _import_hass(*entries: MagicMock) -> MagicMock:
+    """Return a stubbed HomeAssistant instance holding the given entries."""
+    hass = MagicMock()
+    hass.config_entries.async_entries.return_value = list(entries)
+    hass.config_entries.async_remove = AsyncMock()
+    hass.async_create_task.side_effect = lambda coro, _name: coro.close()
+    return hass
+
+
+def _import_entry(
+    options: dict[str, Any], condition_values: dict[str, Any]
+) -> MagicMock:
+    """Return a config entry imported with the given options and values."""
+    return MagicMock(
+        entry_id=f"{options['name']}_entry",
+        unique_id=options["name"],
+        title=options["name"],
+        source=SOURCE_IMPORT,
+        data={DATA_CONDITION_VALUES: condition_values},
+        options=options,
+    )
+
+
+def _import_store(values: dict[str, Any]) -> MagicMock:
+    """Return a stubbed store holding the given values."""
+    store = MagicMock()
+    store.get.side_effect = values.get
+    return store
+
+
+@pytest.mark.asyncio
+async def test_import_new_router() -> None:
+    """Test a new router seeds the store and is created by an import flow."""
+    hass = _import_hass()
+    store = _import_store({})
+
+    await async_import_routers(hass, store, [ROUTER_SCHEMA(ROUTER)])
+
+    store.async_set.assert_any_call("Living Room_day_time_after", "06:00:00")
+    store.async_set.assert_any_call("Living Room_night_sun_below", -6.0)
+    hass.async_create_task.assert_called_once()
+    hass.config_entries.async_update_entry.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_import_unchanged_router_keeps_ui_values() -> None:
+    """Test values changed in the UI survive a restart with unchanged YAML."""
+    options, condition_values = router_to_options(ROUTER_SCHEMA(ROUTER))
+    hass = _import_hass(_import_entry(options, condition_values))
+    store = _import_store(
+        {
+            "Living Room_day_time_after": "07:30:00",
+            "Living Room_night_sun_below": -4.0,
+        }
+    )
+
+    await async_import_routers(hass, store, [ROUTER_SCHEMA(ROUTER)])
+
+    store.async_set.assert_not_called()
+    hass.config_entries.async_update_entry.assert_not_called()
+    hass.async_create_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_import_changed_yaml_value() -> None:
+    """Test a value changed in the YAML overrides the stored value."""
+    options, condition_values = router_to_options(ROUTER_SCHEMA(ROUTER))
+    entry = _import_entry(
+        options, {**condition_values, "Living Room_day_time_after": "05:00:00"}
+    )
+    hass = _import_hass(entry)
+    store = _import_store(
+        {
+            "Living Room_day_time_after": "07:30:00",
+            "Living Room_night_sun_below": -4.0,
+        }
+    )
+
+    await async_import_routers(hass, store, [ROUTER_SCHEMA(ROUTER)])
+
+    store.async_set.assert_called_once_with("Living Room_day_time_after", "06:00:00")
+    hass.config_entries.async_update_entry.assert_called_once_with(
+        entry,
+        title="Living Room",
+        data={DATA_CONDITION_VALUES: condition_values},
+        options=options,
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_removed_router() -> None:
+    """Test imported routers no longer in the YAML are removed."""
+    options, condition_values = router_to_options(ROUTER_SCHEMA(ROUTER))
+    hass = _import_hass(_import_entry(options, condition_values))
+
+    await async_import_routers(hass, _import_store({}), [])
+
+    hass.config_entries.async_remove.assert_awaited_once_with("Living Room_entry")